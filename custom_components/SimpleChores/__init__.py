@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any
 
+from homeassistant.components.todo import TodoItem, TodoItemStatus
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError, ServiceNotFound
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
@@ -18,6 +20,7 @@ _LOGGER = logging.getLogger(__name__)
 from .const import (
     DOMAIN,
     PLATFORMS,
+    SCHEDULE_TYPES,
     SERVICE_ADD_POINTS,
     SERVICE_APPROVE_CHORE,
     SERVICE_CLAIM_REWARD,
@@ -50,6 +53,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Shutdown does not unload config entries, so flush the debounced save here
+    async def _async_flush_on_final_write(_event: Event) -> None:
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_flush_on_final_write)
+    )
+
     try:
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception as ex:
@@ -153,10 +164,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 except ServiceNotFound:
                     _LOGGER.debug("Todo service not available, trying direct entity method")
                     # Method 2: Try to find and call the entity directly via coordinator
-                    if hasattr(coordinator, '_todo_entities') and kid in coordinator._todo_entities:
-                        todo_entity = coordinator._todo_entities[kid]
+                    todo_entity = coordinator._todo_entities.get(kid.lower())
+                    if todo_entity is not None:
                         _LOGGER.debug("Found todo entity for %s, calling direct method", kid)
-                        from homeassistant.components.todo import TodoItem, TodoItemStatus
                         new_item = TodoItem(
                             summary=title_with_points,
                             uid=todo_uid,
@@ -349,6 +359,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if "title" not in data:
                 raise HomeAssistantError("Title is required for parent chore")
 
+            now = datetime.now()
             try:
                 await hass.services.async_call(
                     "calendar", "create_event",
@@ -356,8 +367,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         "entity_id": parents_calendar,
                         "summary": data["title"],
                         "description": data.get("description", ""),
-                        "start_date_time": data.get("start", datetime.now().isoformat()),
-                        "end_date_time": data.get("end", (datetime.now() + timedelta(hours=1)).isoformat()),
+                        "start_date_time": data.get("start", now.isoformat()),
+                        "end_date_time": data.get("end", (now + timedelta(hours=1)).isoformat()),
                         "all_day": data.get("all_day", False),
                     },
                     blocking=True
@@ -388,7 +399,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             schedule_type = data["schedule_type"]
             day_of_week = data.get("day_of_week")
 
-            if schedule_type not in ["daily", "weekly"]:
+            if schedule_type not in SCHEDULE_TYPES:
                 raise HomeAssistantError("schedule_type must be 'daily' or 'weekly'")
                 
             if schedule_type == "weekly" and day_of_week is None:
@@ -458,14 +469,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             data = call.data
             schedule_type = data.get("schedule_type", "daily")
 
-            if schedule_type not in ["daily", "weekly"]:
+            if schedule_type not in SCHEDULE_TYPES:
                 raise HomeAssistantError("schedule_type must be 'daily' or 'weekly'")
 
             if schedule_type == "daily":
                 await coordinator.generate_daily_chores()
                 _LOGGER.info("Successfully generated daily recurring chores")
             elif schedule_type == "weekly":
-                from datetime import datetime
                 current_day = datetime.now().weekday()  # 0=Monday, 6=Sunday
                 target_day = data.get("day_of_week", current_day)
                 
@@ -595,7 +605,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
         # Unregister services if this is the last instance
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, SERVICE_ADD_POINTS)
@@ -1,73 +1,81 @@
 """Button entities for SimpleChores integration."""
 from __future__ import annotations
 
+import logging
+import traceback
+
 from homeassistant.components.button import ButtonEntity
+from homeassistant.components.todo import TodoItemStatus
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .const import CONF_KIDS, DEFAULT_KIDS, DOMAIN, SCHEDULE_TYPES, SIGNAL_APPROVALS_UPDATED
+from .coordinator import SimpleChoresCoordinator, parse_kids
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entities: AddEntitiesCallback):
     coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    kids_csv = entry.data.get("kids", "alex,emma")
-    kids = [k.strip() for k in kids_csv.split(",") if k.strip()]
+    kids = parse_kids(entry.data.get(CONF_KIDS, DEFAULT_KIDS))
 
     # Register callback for dynamic entity creation
     coordinator.set_add_entities_callback(add_entities)
 
-    entities = []
-    # Create chore button
-    entities.append(SimpleChoresCreateChoreButton(coordinator, hass))
-
-    # Create recurring chore button
-    entities.append(SimpleChoresCreateRecurringButton(coordinator, hass))
-
-    # Generate daily chores button
-    entities.append(SimpleChoresGenerateDailyButton(coordinator, hass))
-
-    # Approval status button
-    entities.append(SimpleChoresApprovalStatusButton(coordinator, hass))
-
-    # Dynamic approval/rejection buttons - create discovery buttons for each kid
-    for kid_id in kids:
-        entities.append(SimpleChoresTodayApprovalButton(coordinator, kid_id, hass))
-
-    # Individual chore claim buttons - create a button for each pending chore
-    if hasattr(coordinator.model, 'pending_chores') and coordinator.model.pending_chores:
-        for todo_uid, chore in coordinator.model.pending_chores.items():
-            if chore.status == "pending":  # Only create buttons for pending chores
-                entities.append(SimpleChoresIndividualClaimButton(coordinator, todo_uid, hass))
-
-    # Create approve/reject buttons for existing pending approvals
-    if hasattr(coordinator.model, 'pending_approvals') and coordinator.model.pending_approvals:
-        try:
-            for approval_id, approval in coordinator.model.pending_approvals.items():
-                if hasattr(approval, 'status') and approval.status == "pending_approval":  # Only create buttons for pending approvals
-                    entities.append(SimpleChoresApproveButton(coordinator, approval_id, hass))
-                    entities.append(SimpleChoresRejectButton(coordinator, approval_id, hass))
-        except (TypeError, AttributeError):
-            # Handle cases where coordinator.model is mocked in tests
-            pass
-
-    # Fallback bulk claim button for each kid (for remaining chores after individual claims)
-    for kid_id in kids:
-        entities.append(SimpleChoresTodayClaimButton(coordinator, kid_id, hass))
+    entities = [
+        # Create chore button
+        SimpleChoresCreateChoreButton(coordinator, hass),
+        # Create recurring chore button
+        SimpleChoresCreateRecurringButton(coordinator, hass),
+        # Generate daily chores button
+        SimpleChoresGenerateDailyButton(coordinator, hass),
+        # Approval status button
+        SimpleChoresApprovalStatusButton(coordinator, hass),
+        # Dynamic approval/rejection buttons - create discovery buttons for each kid
+        *(SimpleChoresTodayApprovalButton(coordinator, kid_id, hass) for kid_id in kids),
+        # Individual chore claim buttons - create a button for each pending chore
+        *(
+            SimpleChoresIndividualClaimButton(coordinator, todo_uid, hass)
+            for todo_uid, chore in coordinator.model.pending_chores.items()
+            if chore.status == "pending"  # Only create buttons for pending chores
+        ),
+        # Create approve/reject buttons for existing pending approvals
+        *(
+            button
+            for approval in coordinator.get_pending_approvals()
+            for button in (
+                SimpleChoresApproveButton(coordinator, approval.id, hass),
+                SimpleChoresRejectButton(coordinator, approval.id, hass),
+            )
+        ),
+        # Fallback bulk claim button for each kid (for remaining chores after individual claims)
+        *(SimpleChoresTodayClaimButton(coordinator, kid_id, hass) for kid_id in kids),
+        # Dynamic approval button for parents (shows all pending approvals)
+        SimpleChoresApprovalManagerButton(coordinator, hass),
+        # Reset rejected chores button
+        SimpleChoresResetRejectedButton(coordinator, hass),
+        # Reward buttons - use kids from config since coordinator.model.kids might be empty during setup
+        *(
+            SimpleChoresRewardButton(coordinator, reward.id, kid_id, hass)
+            for reward in coordinator.get_rewards()
+            for kid_id in kids
+        ),
+    ]
 
-    # Dynamic approval button for parents (shows all pending approvals)
-    entities.append(SimpleChoresApprovalManagerButton(coordinator, hass))
+    add_entities(entities, True)
 
-    # Reset rejected chores button
-    entities.append(SimpleChoresResetRejectedButton(coordinator, hass))
+class ApprovalUpdatesButton(ButtonEntity):
+    """Button whose state follows pending chores and approvals."""
 
-    # Reward buttons - use kids from config since coordinator.model.kids might be empty during setup
-    for reward in coordinator.get_rewards():
-        for kid_id in kids:
-            entities.append(SimpleChoresRewardButton(coordinator, reward.id, kid_id, hass))
-
-    add_entities(entities, True)
+    async def async_added_to_hass(self) -> None:
+        """Refresh state whenever the coordinator signals a change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_APPROVALS_UPDATED, self.async_write_ha_state)
+        )
 
 class SimpleChoresCreateChoreButton(ButtonEntity):
     _attr_icon = "mdi:plus-circle"
@@ -79,14 +87,9 @@ class SimpleChoresCreateChoreButton(ButtonEntity):
         self._attr_name = "SimpleChores Create Chore"
 
     async def async_press(self) -> None:
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
         _LOGGER.info("SimpleChores: Create chore button pressed")
 
         # Get values from input helpers - use entity registry for proper entity IDs
-        from homeassistant.helpers import entity_registry as er
-
         er_registry = er.async_get(self._hass)
 
         # Find the text input entities
@@ -102,7 +105,10 @@ class SimpleChoresCreateChoreButton(ButtonEntity):
             elif entry.unique_id == f"{DOMAIN}_chore_kid_input":
                 kid_entity_id = entry.entity_id
 
-        _LOGGER.debug(f"SimpleChores: Found entity IDs - title: {title_entity_id}, points: {points_entity_id}, kid: {kid_entity_id}")
+        _LOGGER.debug(
+            "SimpleChores: Found entity IDs - title: %s, points: %s, kid: %s",
+            title_entity_id, points_entity_id, kid_entity_id,
+        )
 
         if not all([title_entity_id, points_entity_id, kid_entity_id]):
             _LOGGER.warning("SimpleChores: Could not find all required text input entities")
@@ -114,7 +120,10 @@ class SimpleChoresCreateChoreButton(ButtonEntity):
 
         if not all([title_entity, points_entity, kid_entity]):
             _LOGGER.warning("SimpleChores: Could not get states for all text input entities")
-            _LOGGER.warning(f"SimpleChores: Found states - title: {title_entity}, points: {points_entity}, kid: {kid_entity}")
+            _LOGGER.warning(
+                "SimpleChores: Found states - title: %s, points: %s, kid: %s",
+                title_entity, points_entity, kid_entity,
+            )
             return
 
         title = title_entity.state if title_entity else ""
@@ -124,7 +133,7 @@ class SimpleChoresCreateChoreButton(ButtonEntity):
             points = 5
         kid = kid_entity.state if kid_entity else ""
 
-        _LOGGER.info(f"SimpleChores: Creating chore - title: '{title}', points: {points}, kid: '{kid}'")
+        _LOGGER.info("SimpleChores: Creating chore - title: '%s', points: %s, kid: '%s'", title, points, kid)
 
         # Validate inputs
         if not title or title.strip() == "" or title == "Enter chore name":
@@ -150,9 +159,8 @@ class SimpleChoresCreateChoreButton(ButtonEntity):
                     {"entity_id": title_entity_id, "value": ""}
                 )
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to call create_adhoc_chore service: {e}")
-            import traceback
-            _LOGGER.error(f"SimpleChores: Traceback: {traceback.format_exc()}")
+            _LOGGER.error("SimpleChores: Failed to call create_adhoc_chore service: %s", e)
+            _LOGGER.error("SimpleChores: Traceback: %s", traceback.format_exc())
 
 class SimpleChoresRewardButton(ButtonEntity):
     _attr_icon = "mdi:gift"
@@ -204,14 +212,9 @@ class SimpleChoresCreateRecurringButton(ButtonEntity):
         self._attr_name = "SimpleChores Create Recurring Chore"
 
     async def async_press(self) -> None:
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
         _LOGGER.info("SimpleChores: Create recurring chore button pressed")
 
         # Get values from recurring input helpers
-        from homeassistant.helpers import entity_registry as er
-
         er_registry = er.async_get(self._hass)
 
         # Find the recurring input entities
@@ -245,7 +248,10 @@ class SimpleChoresCreateRecurringButton(ButtonEntity):
 
         if not all([title_entity, points_entity, kid_entity, schedule_entity, day_entity]):
             _LOGGER.warning("SimpleChores: Could not get states for all recurring chore input entities")
-            _LOGGER.warning(f"SimpleChores: Found states - title: {title_entity}, points: {points_entity}, kid: {kid_entity}, schedule: {schedule_entity}, day: {day_entity}")
+            _LOGGER.warning(
+                "SimpleChores: Found states - title: %s, points: %s, kid: %s, schedule: %s, day: %s",
+                title_entity, points_entity, kid_entity, schedule_entity, day_entity,
+            )
             return
 
         title = title_entity.state if title_entity else ""
@@ -260,7 +266,10 @@ class SimpleChoresCreateRecurringButton(ButtonEntity):
         except (ValueError, TypeError):
             day_of_week = None
 
-        _LOGGER.info(f"SimpleChores: Creating recurring chore - title: '{title}', points: {points}, kid: '{kid}', schedule: '{schedule_type}', day: {day_of_week}")
+        _LOGGER.info(
+            "SimpleChores: Creating recurring chore - title: '%s', points: %s, kid: '%s', schedule: '%s', day: %s",
+            title, points, kid, schedule_type, day_of_week,
+        )
 
         # Validate inputs
         if not title or title.strip() == "":
@@ -271,8 +280,8 @@ class SimpleChoresCreateRecurringButton(ButtonEntity):
             _LOGGER.warning("SimpleChores: Recurring kid is empty")
             return
             
-        if not schedule_type or schedule_type not in ["daily", "weekly"]:
-            _LOGGER.warning(f"SimpleChores: Invalid schedule type: '{schedule_type}' (must be 'daily' or 'weekly')")
+        if not schedule_type or schedule_type not in SCHEDULE_TYPES:
+            _LOGGER.warning("SimpleChores: Invalid schedule type: '%s' (must be 'daily' or 'weekly')", schedule_type)
             return
 
         try:
@@ -298,9 +307,8 @@ class SimpleChoresCreateRecurringButton(ButtonEntity):
                     {"entity_id": title_entity_id, "value": "Brush teeth"}
                 )
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to call create_recurring_chore service: {e}")
-            import traceback
-            _LOGGER.error(f"SimpleChores: Traceback: {traceback.format_exc()}")
+            _LOGGER.error("SimpleChores: Failed to call create_recurring_chore service: %s", e)
+            _LOGGER.error("SimpleChores: Traceback: %s", traceback.format_exc())
 
 class SimpleChoresGenerateDailyButton(ButtonEntity):
     _attr_icon = "mdi:calendar-today"
@@ -312,9 +320,6 @@ class SimpleChoresGenerateDailyButton(ButtonEntity):
         self._attr_name = "SimpleChores Generate Today's Chores"
 
     async def async_press(self) -> None:
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
         _LOGGER.info("SimpleChores: Generate daily chores button pressed")
 
         try:
@@ -324,9 +329,9 @@ class SimpleChoresGenerateDailyButton(ButtonEntity):
             )
             _LOGGER.info("SimpleChores: Successfully generated daily chores")
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to generate daily chores: {e}")
+            _LOGGER.error("SimpleChores: Failed to generate daily chores: %s", e)
 
-class SimpleChoresApprovalStatusButton(ButtonEntity):
+class SimpleChoresApprovalStatusButton(ApprovalUpdatesButton):
     _attr_icon = "mdi:clipboard-check"
 
     def __init__(self, coord: SimpleChoresCoordinator, hass: HomeAssistant):
@@ -334,18 +339,12 @@ class SimpleChoresApprovalStatusButton(ButtonEntity):
         self._hass = hass
         self._attr_unique_id = f"{DOMAIN}_approval_status_button"
         self._attr_name = "SimpleChores Show Pending Approvals"
-        # Store reference in coordinator for updates
-        if not hasattr(coord, '_approval_buttons'):
-            coord._approval_buttons = []
-        coord._approval_buttons.append(self)
 
     @property
     def name(self) -> str:
         if self._coord.model:
             pending_count = len(self._coord.get_pending_approvals())
-            import logging
-            _LOGGER = logging.getLogger(__name__)
-            _LOGGER.debug(f"SimpleChores: Approval button name check - pending count: {pending_count}")
+            _LOGGER.debug("SimpleChores: Approval button name check - pending count: %s", pending_count)
             return f"SimpleChores Pending Approvals ({pending_count})"
         return "SimpleChores Pending Approvals (0)"
 
@@ -353,23 +352,21 @@ class SimpleChoresApprovalStatusButton(ButtonEntity):
     def available(self) -> bool:
         if self._coord.model:
             pending_count = len(self._coord.get_pending_approvals())
-            import logging
-            _LOGGER = logging.getLogger(__name__)
-            _LOGGER.debug(f"SimpleChores: Approval button availability check - pending count: {pending_count}")
+            _LOGGER.debug("SimpleChores: Approval button availability check - pending count: %s", pending_count)
             return pending_count > 0
         return False
 
     async def async_press(self) -> None:
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
         pending_approvals = self._coord.get_pending_approvals()
-        _LOGGER.info(f"SimpleChores: {len(pending_approvals)} pending approvals:")
+        _LOGGER.info("SimpleChores: %s pending approvals:", len(pending_approvals))
 
         for approval in pending_approvals:
-            _LOGGER.info(f"  - ID: {approval.id}, Kid: {approval.kid_id}, Chore: {approval.title}, Points: {approval.points}")
-            _LOGGER.info(f"    To approve: simplechores.approve_chore with approval_id: {approval.id}")
-            _LOGGER.info(f"    To reject: simplechores.reject_chore with approval_id: {approval.id}")
+            _LOGGER.info(
+                "  - ID: %s, Kid: %s, Chore: %s, Points: %s",
+                approval.id, approval.kid_id, approval.title, approval.points,
+            )
+            _LOGGER.info("    To approve: simplechores.approve_chore with approval_id: %s", approval.id)
+            _LOGGER.info("    To reject: simplechores.reject_chore with approval_id: %s", approval.id)
 
 class SimpleChoresApproveButton(ButtonEntity):
     """Button to approve a specific chore."""
@@ -391,8 +388,6 @@ class SimpleChoresApproveButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         try:
             await self._hass.services.async_call(
@@ -401,7 +396,7 @@ class SimpleChoresApproveButton(ButtonEntity):
             )
             _LOGGER.info("SimpleChores: Approved chore %s", self._approval_id)
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to approve chore {self._approval_id}: {e}")
+            _LOGGER.error("SimpleChores: Failed to approve chore %s: %s", self._approval_id, e)
 
     @property
     def available(self) -> bool:
@@ -432,8 +427,6 @@ class SimpleChoresRejectButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         try:
             await self._hass.services.async_call(
@@ -442,7 +435,7 @@ class SimpleChoresRejectButton(ButtonEntity):
             )
             _LOGGER.info("SimpleChores: Rejected chore %s", self._approval_id)
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to reject chore {self._approval_id}: {e}")
+            _LOGGER.error("SimpleChores: Failed to reject chore %s: %s", self._approval_id, e)
 
     @property
     def available(self) -> bool:
@@ -473,8 +466,6 @@ class SimpleChoresClaimButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press - kid claims chore completion."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         try:
             await self._hass.services.async_call(
@@ -483,7 +474,7 @@ class SimpleChoresClaimButton(ButtonEntity):
             )
             _LOGGER.info("SimpleChores: Requested approval for chore %s", self._todo_uid)
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Failed to request approval for chore {self._todo_uid}: {e}")
+            _LOGGER.error("SimpleChores: Failed to request approval for chore %s: %s", self._todo_uid, e)
 
     @property
     def available(self) -> bool:
@@ -505,9 +496,6 @@ class SimpleChoresResetRejectedButton(ButtonEntity):
         self._attr_name = "SimpleChores Reset Rejected Chores"
 
     async def async_press(self) -> None:
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
         _LOGGER.info("SimpleChores: Reset rejected chores button pressed")
 
         # Find rejected chores and reset them
@@ -520,15 +508,13 @@ class SimpleChoresResetRejectedButton(ButtonEntity):
                 reset_count += 1
 
                 # Also reset the todo item if it exists
-                if hasattr(self._coord, '_todo_entities') and chore.kid_id in self._coord._todo_entities:
-                    todo_entity = self._coord._todo_entities[chore.kid_id]
+                todo_entity = self._coord._todo_entities.get(chore.kid_id.lower())
+                if todo_entity is not None:
                     for item in todo_entity._items:
                         if item.uid == chore.todo_uid:
                             # Remove [PENDING APPROVAL] prefix if present
-                            if item.summary.startswith("[PENDING APPROVAL]"):
-                                item.summary = item.summary.replace("[PENDING APPROVAL] ", "")
+                            item.summary = item.summary.removeprefix("[PENDING APPROVAL] ")
                             # Reset to uncompleted
-                            from homeassistant.components.todo import TodoItemStatus
                             item.status = TodoItemStatus.NEEDS_ACTION
                             break
                     todo_entity.async_write_ha_state()
@@ -536,14 +522,17 @@ class SimpleChoresResetRejectedButton(ButtonEntity):
         # Remove rejected approvals
         rejected_approvals = [a for a in self._coord.model.pending_approvals.values() if a.status == "rejected"]
         for approval in rejected_approvals:
-            del self._coord.model.pending_approvals[approval.id]
+            self._coord.remove_approval(approval.id)
 
-        await self._coord.async_save()
+        self._coord.async_schedule_save()
 
-        _LOGGER.info(f"SimpleChores: Reset {reset_count} rejected chores and removed {len(rejected_approvals)} rejected approvals")
+        _LOGGER.info(
+            "SimpleChores: Reset %s rejected chores and removed %s rejected approvals",
+            reset_count, len(rejected_approvals),
+        )
 
 
-class SimpleChoresTodayClaimButton(ButtonEntity):
+class SimpleChoresTodayClaimButton(ApprovalUpdatesButton):
     """Dynamic button for kids to claim their pending chores for approval."""
     _attr_icon = "mdi:hand-heart"
 
@@ -553,11 +542,6 @@ class SimpleChoresTodayClaimButton(ButtonEntity):
         self._kid_id = kid_id
         self._attr_unique_id = f"{DOMAIN}_claim_chores_{kid_id}"
         self._attr_name = f"SimpleChores Claim Chores ({kid_id.capitalize()})"
-        
-        # Register with coordinator for updates
-        if not hasattr(coord, '_claim_buttons'):
-            coord._claim_buttons = []
-        coord._claim_buttons.append(self)
 
     @property
     def available(self) -> bool:
@@ -567,11 +551,7 @@ class SimpleChoresTodayClaimButton(ButtonEntity):
         
         # Check if this kid has multiple pending chores
         # Individual buttons handle single chores, this is for bulk claiming
-        pending_chores = [
-            chore for chore in self._coord.model.pending_chores.values() 
-            if chore.kid_id == self._kid_id and chore.status == "pending"
-        ]
-        return len(pending_chores) > 1  # Only show for multiple chores
+        return len(self._coord.get_pending_chores(self._kid_id)) > 1  # Only show for multiple chores
 
     @property
     def name(self) -> str:
@@ -579,27 +559,19 @@ class SimpleChoresTodayClaimButton(ButtonEntity):
         if self._coord.model is None:
             return f"SimpleChores Claim Chores ({self._kid_id.capitalize()})"
             
-        pending_count = len([
-            chore for chore in self._coord.model.pending_chores.values() 
-            if chore.kid_id == self._kid_id and chore.status == "pending"
-        ])
+        pending_count = len(self._coord.get_pending_chores(self._kid_id))
         
         return f"SimpleChores Claim ALL Chores ({self._kid_id.capitalize()}) - {pending_count} remaining"
 
     async def async_press(self) -> None:
         """Claim ALL pending chores for this kid (bulk operation)."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         if self._coord.model is None:
             _LOGGER.warning("No model available")
             return
             
         # Find all pending chores for this kid
-        pending_chores = [
-            chore for chore in self._coord.model.pending_chores.values()
-            if chore.kid_id == self._kid_id and chore.status == "pending"
-        ]
+        pending_chores = self._coord.get_pending_chores(self._kid_id)
                 
         if not pending_chores:
             _LOGGER.warning("No pending chores found for %s", self._kid_id)
@@ -623,7 +595,7 @@ class SimpleChoresTodayClaimButton(ButtonEntity):
                     claimed_count, len(pending_chores), self._kid_id)
 
 
-class SimpleChoresIndividualClaimButton(ButtonEntity):
+class SimpleChoresIndividualClaimButton(ApprovalUpdatesButton):
     """Individual button for claiming a specific chore."""
     _attr_icon = "mdi:check-circle"
 
@@ -640,11 +612,6 @@ class SimpleChoresIndividualClaimButton(ButtonEntity):
         else:
             self._attr_name = f"SimpleChores Claim Chore {todo_uid[:8]}"
 
-        # Register with coordinator for updates
-        if not hasattr(coord, '_individual_claim_buttons'):
-            coord._individual_claim_buttons = []
-        coord._individual_claim_buttons.append(self)
-
     @property
     def available(self) -> bool:
         """Show button only when chore exists and is pending."""
@@ -668,8 +635,6 @@ class SimpleChoresIndividualClaimButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Claim this specific chore."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         chore = self._coord.get_pending_chore(self._todo_uid)
         if not chore:
@@ -690,7 +655,7 @@ class SimpleChoresIndividualClaimButton(ButtonEntity):
             _LOGGER.error("Failed to claim chore %s: %s", self._todo_uid, e)
 
 
-class SimpleChoresTodayApprovalButton(ButtonEntity):
+class SimpleChoresTodayApprovalButton(ApprovalUpdatesButton):
     """Dynamic button for parents to approve/reject chores for a specific kid."""
     _attr_icon = "mdi:clipboard-check"
 
@@ -700,11 +665,6 @@ class SimpleChoresTodayApprovalButton(ButtonEntity):
         self._kid_id = kid_id
         self._attr_unique_id = f"{DOMAIN}_approve_chores_{kid_id}"
         self._attr_name = f"SimpleChores Manage Approvals ({kid_id.capitalize()})"
-        
-        # Register with coordinator for updates
-        if not hasattr(coord, '_approval_manager_buttons'):
-            coord._approval_manager_buttons = []
-        coord._approval_manager_buttons.append(self)
 
     @property
     def available(self) -> bool:
@@ -714,8 +674,8 @@ class SimpleChoresTodayApprovalButton(ButtonEntity):
         
         # Check if this kid has any pending approvals
         pending_approvals = [
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.kid_id == self._kid_id and approval.status == "pending_approval"
+            approval for approval in self._coord.get_pending_approvals()
+            if approval.kid_id == self._kid_id
         ]
         return len(pending_approvals) > 0
 
@@ -726,16 +686,14 @@ class SimpleChoresTodayApprovalButton(ButtonEntity):
             return f"SimpleChores Manage Approvals ({self._kid_id.capitalize()})"
             
         pending_count = len([
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.kid_id == self._kid_id and approval.status == "pending_approval"
+            approval for approval in self._coord.get_pending_approvals()
+            if approval.kid_id == self._kid_id
         ])
         
         return f"SimpleChores Manage Approvals ({self._kid_id.capitalize()}) - {pending_count} pending"
 
     async def async_press(self) -> None:
         """Log all pending approvals for this kid with approve/reject instructions."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         if self._coord.model is None:
             _LOGGER.warning("No model available")
@@ -743,8 +701,8 @@ class SimpleChoresTodayApprovalButton(ButtonEntity):
             
         # Find all pending approvals for this kid
         pending_approvals = [
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.kid_id == self._kid_id and approval.status == "pending_approval"
+            approval for approval in self._coord.get_pending_approvals()
+            if approval.kid_id == self._kid_id
         ]
         
         if not pending_approvals:
@@ -759,7 +717,7 @@ class SimpleChoresTodayApprovalButton(ButtonEntity):
             _LOGGER.info("")
 
 
-class SimpleChoresApprovalManagerButton(ButtonEntity):
+class SimpleChoresApprovalManagerButton(ApprovalUpdatesButton):
     """Unified button for managing all pending approvals across all kids."""
     _attr_icon = "mdi:account-supervisor"
 
@@ -768,11 +726,6 @@ class SimpleChoresApprovalManagerButton(ButtonEntity):
         self._hass = hass
         self._attr_unique_id = f"{DOMAIN}_approval_manager"
         self._attr_name = "SimpleChores Approval Manager"
-        
-        # Register with coordinator for updates  
-        if not hasattr(coord, '_approval_manager_buttons'):
-            coord._approval_manager_buttons = []
-        coord._approval_manager_buttons.append(self)
 
     @property
     def available(self) -> bool:
@@ -780,10 +733,7 @@ class SimpleChoresApprovalManagerButton(ButtonEntity):
         if self._coord.model is None:
             return False
         
-        pending_approvals = [
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.status == "pending_approval"
-        ]
+        pending_approvals = self._coord.get_pending_approvals()
         return len(pending_approvals) > 0
 
     @property  
@@ -792,10 +742,7 @@ class SimpleChoresApprovalManagerButton(ButtonEntity):
         if self._coord.model is None:
             return "SimpleChores Approval Manager"
             
-        pending_count = len([
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.status == "pending_approval"
-        ])
+        pending_count = len(self._coord.get_pending_approvals())
         
         if pending_count == 0:
             return "SimpleChores Approval Manager"
@@ -804,18 +751,13 @@ class SimpleChoresApprovalManagerButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Show all pending approvals with bulk management options."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
         
         if self._coord.model is None:
             _LOGGER.warning("No model available")
             return
             
         # Find all pending approvals
-        pending_approvals = [
-            approval for approval in self._coord.model.pending_approvals.values() 
-            if approval.status == "pending_approval"
-        ]
+        pending_approvals = self._coord.get_pending_approvals()
         
         if not pending_approvals:
             _LOGGER.info("🎉 No pending approvals - all caught up!")
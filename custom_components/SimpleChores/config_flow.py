@@ -7,7 +7,7 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 import voluptuous as vol
 
-from .const import CONF_KIDS, CONF_PARENTS_CALENDAR, CONF_USE_TODO, DOMAIN
+from .const import CONF_KIDS, CONF_PARENTS_CALENDAR, CONF_USE_TODO, DEFAULT_KIDS, DOMAIN
 
 
 class SimpleChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -23,7 +23,7 @@ class SimpleChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title="SimpleChores", data=user_input)
 
         data_schema = vol.Schema({
-            vol.Required(CONF_KIDS, default="alex,emma"): str,
+            vol.Required(CONF_KIDS, default=DEFAULT_KIDS): str,
             vol.Optional(CONF_USE_TODO, default=True): bool,
             vol.Optional(CONF_PARENTS_CALENDAR, default="calendar.parents"): str,
         })
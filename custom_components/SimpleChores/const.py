@@ -5,9 +5,17 @@ PLATFORMS = ["number", "todo", "sensor", "text", "button"]
 CONF_KIDS = "kids"
 CONF_USE_TODO = "use_todo"
 CONF_PARENTS_CALENDAR = "parents_calendar"
+DEFAULT_KIDS = "alex,emma"
 
-STORAGE_VERSION = 2
+STORAGE_VERSION = 3  # 3: ledger stored column-wise
 STORAGE_KEY = f"{DOMAIN}_ledger"
+SAVE_DELAY = 0.5  # seconds to coalesce storage writes
+
+# Recurring chore schedule types
+SCHEDULE_TYPES = frozenset(("daily", "weekly"))
+
+# Dispatcher signal sent when chores or approvals change
+SIGNAL_APPROVALS_UPDATED = f"{DOMAIN}_approval_update"
 
 # Services
 SERVICE_ADD_POINTS = "add_points"
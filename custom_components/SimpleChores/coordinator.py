@@ -1,17 +1,49 @@
 """Data coordinator for SimpleChores integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable
 from datetime import datetime
+from functools import lru_cache
 import logging
+from secrets import token_hex
+import time
 from typing import Any
 import uuid
-
-from homeassistant.core import HomeAssistant
+import weakref
+
+from homeassistant.components.todo import TodoItem, TodoItemStatus
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SAVE_DELAY, SIGNAL_APPROVALS_UPDATED
+from .models import (
+    Kid,
+    LedgerEntry,
+    PendingApproval,
+    PendingChore,
+    RecurringChore,
+    Reward,
+    RewardProgress,
+    StorageModel,
+    TodoItemModel,
+)
+from .storage import SimpleChoresStore
 
 _LOGGER = logging.getLogger(__name__)
 
-from .models import Kid, LedgerEntry, PendingApproval, PendingChore, RecurringChore, Reward, RewardProgress, StorageModel, TodoItemModel
-from .storage import SimpleChoresStore
+
+@lru_cache(maxsize=8)
+def parse_kids(kids_csv: str) -> tuple[str, ...]:
+    """Split the configured kids CSV into unique kid ids, in configured order.
+
+    Every platform reads the same entry data during setup, so the parsed
+    tuple is cached per CSV string.
+    """
+    # dict.fromkeys drops repeats, which would otherwise create duplicate entities
+    return tuple(dict.fromkeys(kid for kid in map(str.strip, kids_csv.split(",")) if kid))
 
 
 class SimpleChoresCoordinator:
@@ -23,13 +55,66 @@ class SimpleChoresCoordinator:
         self.store = SimpleChoresStore(hass)
         self.model: StorageModel | None = None
         self._add_entities_callback: callable | None = None
+        # Last points value pushed to each kid's number entity
+        self._last_written_points: dict[str, int] = {}
+        # Entities register themselves here when they are created; weak values
+        # let entities dropped by HA (reload, disable) fall out on their own
+        self._entities: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+        self._todo_entities: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+        # Callbacks run after each ledger append for a kid, keyed by normalized kid id
+        self._kid_listeners: defaultdict[str, set[Callable[[], None]]] = defaultdict(set)
+        # Bumped whenever the set of approvals awaiting a decision changes
+        self._approvals_version = 0
+        # (active approvals index, approvals version, list) behind get_pending_approvals
+        self._pending_approvals_cache: tuple[dict, int, list[PendingApproval]] | None = None
+        # Coalesce bursts of mutations into a single storage write
+        self._save_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=SAVE_DELAY, immediate=False, function=self.async_save
+        )
 
     async def async_init(self) -> None:
         """Initialize the coordinator by loading data."""
         self.model = await self.store.async_load()
+        self._normalize_kid_ids()
         # Add default rewards if none exist
         if not self.model.rewards:
             await self._add_default_rewards()
+            await self.async_save()
+
+    def _normalize_kid_ids(self) -> None:
+        """Re-key kids that older versions stored in mixed case.
+
+        Ledger entries need no pass here; LedgerEntry lowercases on load.
+        """
+        kids = self.model.kids
+        for key in [k for k in kids if k != self._norm(k)]:
+            kid = kids.pop(key)
+            norm = self._norm(key)
+            existing = kids.get(norm)
+            if existing is None:
+                kid.id = norm
+                kids[norm] = kid
+            else:
+                # Config and service calls could create the same kid in two casings
+                _LOGGER.warning("Merging kid %s (%d points) into %s (%d points)",
+                                key, kid.points, norm, existing.points)
+                existing.points += kid.points
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled save and flush the model to storage."""
+        self._save_debouncer.async_shutdown()
+        if self.model is not None:
+            await self.async_save()
+
+    @callback
+    def register_entity(self, kid_id: str, entity: Any) -> None:
+        """Register a kid's points entity for direct state updates."""
+        self._entities[self._norm(kid_id)] = entity
+
+    @callback
+    def register_todo_entity(self, kid_id: str, entity: Any) -> None:
+        """Register a kid's todo list for direct item creation."""
+        self._todo_entities[self._norm(kid_id)] = entity
 
     def set_add_entities_callback(self, callback: callable) -> None:
         """Set callback for dynamically adding new entities."""
@@ -41,34 +126,58 @@ class SimpleChoresCoordinator:
             raise RuntimeError("Model not initialized")
         await self.store.async_save(self.model)
 
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a debounced save of the model data."""
+        self._save_debouncer.async_schedule_call()
+
     # ---- kids/points ----
+    @staticmethod
+    def _norm(kid_id: str) -> str:
+        """Return the lowercase key kids and their entities are stored under."""
+        return kid_id.lower()
+
     async def ensure_kid(self, kid_id: str, name: str | None = None) -> None:
         """Ensure a kid exists in the system."""
         if self.model is None:
             raise RuntimeError("Model not initialized")
-        if kid_id not in self.model.kids:
-            self.model.kids[kid_id] = Kid(id=kid_id, name=name or kid_id)
-            await self.async_save()
+        key = self._norm(kid_id)
+        if key not in self.model.kids:
+            self.model.kids[key] = Kid(id=key, name=name or kid_id)
+            self.async_schedule_save()
 
     def get_points(self, kid_id: str) -> int:
         """Get current points for a kid."""
-        if not self.model or kid_id not in self.model.kids:
+        if not self.model:
             return 0
-        return self.model.kids[kid_id].points
+        kid = self.model.kids.get(self._norm(kid_id))
+        return kid.points if kid else 0
 
     async def add_points(self, kid_id: str, amount: int, reason: str, kind: str = "earn") -> None:
-        """Add points to a kid's account."""
+        """Add points to a kid's account; a negative amount removes them."""
         if self.model is None:
             raise RuntimeError("Model not initialized")
-        if kid_id not in self.model.kids:
-            self.model.kids[kid_id] = Kid(id=kid_id, name=kid_id)
-        self.model.kids[kid_id].points += amount
+        key = self._norm(kid_id)
+        if key not in self.model.kids:
+            self.model.kids[key] = Kid(id=key, name=kid_id)
+        self.model.kids[key].points += amount
+        # The append is O(1) and stays synchronous so ledger-derived sensors
+        # see it immediately; the write to disk is left to the debouncer.
         self.model.ledger.append(
-            LedgerEntry(ts=datetime.now().timestamp(), kid_id=kid_id, delta=amount, reason=reason, kind=kind)
+            LedgerEntry(ts=time.time(), kid_id=key, delta=amount, reason=reason, kind=kind)
         )
-        await self.async_save()
+        self.async_schedule_save()
+        for listener in tuple(self._kid_listeners.get(key, ())):
+            listener()
         # Trigger entity updates
-        await self._update_entities(kid_id)
+        await self._update_entities(key)
+
+    @callback
+    def async_add_kid_listener(self, kid_id: str, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever a ledger entry is added for kid_id; returns the unsubscribe."""
+        listeners = self._kid_listeners[self._norm(kid_id)]
+        listeners.add(listener)
+        return lambda: listeners.discard(listener)
 
     async def remove_points(self, kid_id: str, amount: int, reason: str, kind: str = "spend") -> None:
         """Remove points from a kid's account."""
@@ -96,13 +205,12 @@ class SimpleChoresCoordinator:
         ]
         for reward in default_rewards:
             self.model.rewards[reward.id] = reward
-        await self.async_save()
 
-    def get_rewards(self) -> list[Reward]:
-        """Get all available rewards."""
+    def get_rewards(self) -> Collection[Reward]:
+        """Get all available rewards as a read-only view."""
         if not self.model:
-            return []
-        return list(self.model.rewards.values())
+            return ()
+        return self.model.rewards.values()
 
     def get_reward(self, reward_id: str) -> Reward | None:
         """Get a specific reward by ID."""
@@ -114,15 +222,15 @@ class SimpleChoresCoordinator:
         """Add a new reward and return its ID."""
         if self.model is None:
             raise RuntimeError("Model not initialized")
-        reward_id = str(uuid.uuid4())[:8]
+        reward_id = token_hex(4)
         reward = Reward(id=reward_id, title=title, cost=cost, description=description, create_calendar_event=create_calendar_event)
         self.model.rewards[reward_id] = reward
-        await self.async_save()
+        self.async_schedule_save()
         return reward_id
 
     def _get_progress_key(self, kid_id: str, reward_id: str) -> str:
         """Generate key for reward progress tracking."""
-        return f"{kid_id}_{reward_id}"
+        return f"{self._norm(kid_id)}_{reward_id}"
 
     def get_reward_progress(self, kid_id: str, reward_id: str) -> RewardProgress | None:
         """Get progress for a specific kid-reward combination."""
@@ -146,6 +254,7 @@ class SimpleChoresCoordinator:
             raise RuntimeError("Model not initialized")
         
         achieved_rewards = []
+        completed_date_obj = datetime.strptime(completed_date, "%Y-%m-%d").date()
         
         for reward in self.model.rewards.values():
             # Skip point-based rewards
@@ -166,17 +275,13 @@ class SimpleChoresCoordinator:
                 progress.current_completions += 1
                 if progress.current_completions >= reward.required_completions:
                     progress.completed = True
-                    progress.completion_date = datetime.now().timestamp()
+                    progress.completion_date = time.time()
                     achieved_rewards.append(reward.id)
                     _LOGGER.info("Reward achieved: %s completed %s (%d/%d)", 
                                kid_id, reward.title, progress.current_completions, reward.required_completions)
             
             elif reward.is_streak_based():
                 # Check if this continues the streak
-                from datetime import timedelta
-                today = datetime.now().date()
-                completed_date_obj = datetime.strptime(completed_date, "%Y-%m-%d").date()
-                
                 if progress.last_completion_date:
                     last_date = datetime.strptime(progress.last_completion_date, "%Y-%m-%d").date()
                     days_diff = (completed_date_obj - last_date).days
@@ -198,13 +303,13 @@ class SimpleChoresCoordinator:
                 
                 if progress.current_streak >= reward.required_streak_days:
                     progress.completed = True
-                    progress.completion_date = datetime.now().timestamp()
+                    progress.completion_date = time.time()
                     achieved_rewards.append(reward.id)
                     _LOGGER.info("Streak reward achieved: %s completed %s (%d days)", 
                                kid_id, reward.title, progress.current_streak)
         
         if achieved_rewards:
-            await self.async_save()
+            self.async_schedule_save()
             # Trigger reward celebration/notification
             await self._notify_reward_achievements(kid_id, achieved_rewards)
         
@@ -212,7 +317,6 @@ class SimpleChoresCoordinator:
 
     async def _notify_reward_achievements(self, kid_id: str, reward_ids: list[str]) -> None:
         """Handle reward achievements - create calendar events, fire events, etc."""
-        from datetime import timedelta
         
         for reward_id in reward_ids:
             reward = self.get_reward(reward_id)
@@ -221,13 +325,10 @@ class SimpleChoresCoordinator:
                 
             _LOGGER.info("🎉 %s achieved reward: %s", kid_id, reward.title)
             
-            # Create calendar event if enabled
-            if reward.create_calendar_event:
-                # This will be handled by the service layer to access hass services
-                pass
+            # Calendar events for rewards are created by the service layer
             
             # Fire Home Assistant event for automations
-            if hasattr(self, 'hass'):
+            if self.hass is not None:
                 self.hass.bus.async_fire(
                     "simplechores_reward_achieved",
                     {
@@ -238,19 +339,17 @@ class SimpleChoresCoordinator:
                 )
 
     # ---- chores ----
-    async def create_pending_chore(self, kid_id: str, title: str, points: int, chore_type: str | None = None) -> str:
+    async def create_pending_chore(
+        self,
+        kid_id: str,
+        title: str,
+        points: int,
+        chore_type: str | None = None,
+        now: float | None = None,
+    ) -> str:
         """Create a chore and return the todo_uid to track it"""
-        todo_uid = str(uuid.uuid4())
-        chore = PendingChore(
-            todo_uid=todo_uid,
-            kid_id=kid_id,
-            title=title,
-            points=points,
-            created_ts=datetime.now().timestamp(),
-            chore_type=chore_type
-        )
-        self.model.pending_chores[todo_uid] = chore
-        await self.async_save()
+        todo_uid = self._add_pending_chore(kid_id, title, points, chore_type, now)
+        self.async_schedule_save()
         
         # Update dynamic buttons when new chore is created (with error handling for tests)
         try:
@@ -261,56 +360,74 @@ class SimpleChoresCoordinator:
         
         return todo_uid
 
+    def _add_pending_chore(
+        self, kid_id: str, title: str, points: int, chore_type: str | None, now: float | None
+    ) -> str:
+        """Add a pending chore to the model without saving or notifying entities."""
+        todo_uid = str(uuid.uuid4())
+        chore = PendingChore(
+            todo_uid=todo_uid,
+            kid_id=kid_id,
+            title=title,
+            points=points,
+            created_ts=now if now is not None else time.time(),
+            chore_type=chore_type
+        )
+        self.model.add_pending_chore(chore)
+        return todo_uid
+
     async def complete_chore_by_uid(self, todo_uid: str) -> bool:
         """Complete a chore by todo UID and award points"""
-        if todo_uid in self.model.pending_chores:
-            chore = self.model.pending_chores.pop(todo_uid)
+        chore = self.remove_pending_chore(todo_uid)
+        if chore is not None:
             await self.add_points(chore.kid_id, chore.points, f"Chore: {chore.title}", "earn")
             
             # Update reward progress
             completed_date = datetime.now().strftime("%Y-%m-%d")
-            achieved_rewards = await self.update_reward_progress(chore.kid_id, chore.chore_type, completed_date)
-            
-            await self.async_save()
+            await self.update_reward_progress(chore.kid_id, chore.chore_type, completed_date)
             return True
         return False
 
     def get_pending_chore(self, todo_uid: str) -> PendingChore | None:
         return self.model.pending_chores.get(todo_uid)
 
+    def get_pending_chores(self, kid_id: str, status: str | None = "pending") -> list[PendingChore]:
+        """Get a kid's pending chores, optionally filtered by status."""
+        chores = self.model.pending_by_kid.get(self._norm(kid_id), {}).values()
+        return [c for c in chores if status is None or c.status == status]
+
+    def remove_pending_chore(self, todo_uid: str) -> PendingChore | None:
+        """Remove a pending chore and drop it from the per-kid index."""
+        return self.model.remove_pending_chore(todo_uid)
+
     async def _update_entities(self, kid_id: str) -> None:
         """Trigger entity updates after point changes."""
         _LOGGER.debug("Triggering entity updates for %s", kid_id)
 
         # Direct entity state update - most reliable method
-        entity = None
-        if hasattr(self, '_entities'):
-            # Try exact match first
-            if kid_id in self._entities:
-                entity = self._entities[kid_id]
-            else:
-                # Try case-insensitive match
-                for registered_kid, registered_entity in self._entities.items():
-                    if registered_kid.lower() == kid_id.lower():
-                        entity = registered_entity
-                        break
-
-        if entity:
-            entity.async_write_ha_state()
-            _LOGGER.debug("Updated entity state for %s", kid_id)
+        key = self._norm(kid_id)
+        entity = self._entities.get(key)
+
+        if entity is not None:
+            points = self.get_points(key)
+            if self._last_written_points.get(key) != points:
+                self._last_written_points[key] = points
+                entity.async_write_ha_state()
+                _LOGGER.debug("Updated entity state for %s", kid_id)
+            return
+
+        if self._entities:
+            _LOGGER.warning("No entity found for %s. Available: %s",
+                          kid_id, list(self._entities.keys()))
         else:
-            if hasattr(self, '_entities'):
-                _LOGGER.warning("No entity found for %s. Available: %s", 
-                              kid_id, list(self._entities.keys()))
-            else:
-                _LOGGER.debug("No entities registered yet")
+            _LOGGER.debug("No entities registered yet")
 
-        # Fallback: trigger entity update via service
-        entity_id = f"number.{kid_id}_points"
+        # Fallback: entity not registered with us, ask HA to refresh it
+        entity_id = f"number.{key}_points"
         try:
             await self.hass.services.async_call(
-                "homeassistant", "update_entity", 
-                {"entity_id": entity_id}, 
+                "homeassistant", "update_entity",
+                {"entity_id": entity_id},
                 blocking=False
             )
         except Exception as ex:
@@ -320,7 +437,7 @@ class SimpleChoresCoordinator:
     async def create_recurring_chore(self, kid_id: str, title: str, points: int, schedule_type: str, day_of_week: int = None, chore_type: str = None) -> str:
         """Create a recurring chore template"""
         assert self.model
-        chore_id = str(uuid.uuid4())[:8]
+        chore_id = token_hex(4)
 
         recurring_chore = RecurringChore(
             id=chore_id,
@@ -333,50 +450,57 @@ class SimpleChoresCoordinator:
             chore_type=chore_type
         )
 
-        self.model.recurring_chores[chore_id] = recurring_chore
-        await self.async_save()
+        self.model.add_recurring_chore(recurring_chore)
+        self.async_schedule_save()
         return chore_id
 
-    def get_recurring_chores(self, kid_id: str = None) -> list[RecurringChore]:
-        """Get recurring chores, optionally filtered by kid"""
-        chores = list(self.model.recurring_chores.values())
-        if kid_id:
-            chores = [c for c in chores if c.kid_id == kid_id]
-        return chores
+    def get_recurring_chores(self, kid_id: str = None) -> Collection[RecurringChore]:
+        """Get recurring chores as a read-only view, optionally filtered by kid"""
+        if not kid_id:
+            return self.model.recurring_chores.values()
+        return self.model.recurring_by_kid.get(self._norm(kid_id), {}).values()
+
+    async def _generate(self, predicate: Callable[[RecurringChore], bool]) -> None:
+        """Create pending chores for every recurring chore matching predicate."""
+        now = time.time()
+        created = [
+            (chore, self._add_pending_chore(chore.kid_id, chore.title, chore.points, chore.chore_type, now))
+            for chore in self.model.recurring_chores.values()
+            if predicate(chore)
+        ]
+        if not created:
+            return
+        self.async_schedule_save()
+
+        try:
+            await self._update_approval_buttons()
+        except Exception:
+            # Ignore entity update errors in test environments
+            pass
+
+        # Also create the items in the kids' todo lists, if available
+        todo_entities = self._todo_entities
+        await asyncio.gather(*(
+            todo_entities[key].async_create_item(
+                TodoItem(
+                    summary=f"{chore.title} (+{chore.points})",
+                    uid=todo_uid,
+                    status=TodoItemStatus.NEEDS_ACTION
+                )
+            )
+            for chore, todo_uid in created
+            if (key := self._norm(chore.kid_id)) in todo_entities
+        ))
 
     async def generate_daily_chores(self):
         """Generate daily recurring chores"""
-        for chore in self.model.recurring_chores.values():
-            if chore.enabled and chore.schedule_type == "daily":
-                # Create a new todo item for this chore
-                todo_uid = await self.create_pending_chore(chore.kid_id, chore.title, chore.points, chore.chore_type)
-                # Also create in todo list if available
-                if hasattr(self, '_todo_entities') and chore.kid_id in self._todo_entities:
-                    from homeassistant.components.todo import TodoItem, TodoItemStatus
-                    todo_entity = self._todo_entities[chore.kid_id]
-                    new_item = TodoItem(
-                        summary=f"{chore.title} (+{chore.points})",
-                        uid=todo_uid,
-                        status=TodoItemStatus.NEEDS_ACTION
-                    )
-                    await todo_entity.async_create_item(new_item)
+        await self._generate(lambda c: c.enabled and c.schedule_type == "daily")
 
     async def generate_weekly_chores(self, target_day: int):
         """Generate weekly recurring chores for specific day (0=Monday, 6=Sunday)"""
-        for chore in self.model.recurring_chores.values():
-            if chore.enabled and chore.schedule_type == "weekly" and chore.day_of_week == target_day:
-                # Create a new todo item for this chore
-                todo_uid = await self.create_pending_chore(chore.kid_id, chore.title, chore.points, chore.chore_type)
-                # Also create in todo list if available
-                if hasattr(self, '_todo_entities') and chore.kid_id in self._todo_entities:
-                    from homeassistant.components.todo import TodoItem, TodoItemStatus
-                    todo_entity = self._todo_entities[chore.kid_id]
-                    new_item = TodoItem(
-                        summary=f"{chore.title} (+{chore.points})",
-                        uid=todo_uid,
-                        status=TodoItemStatus.NEEDS_ACTION
-                    )
-                    await todo_entity.async_create_item(new_item)
+        await self._generate(
+            lambda c: c.enabled and c.schedule_type == "weekly" and c.day_of_week == target_day
+        )
 
     # ---- parental approval ----
     async def request_approval(self, todo_uid: str) -> str:
@@ -392,7 +516,8 @@ class SimpleChoresCoordinator:
                               todo_uid, chore.status)
                 return None
                 
-            approval_id = str(uuid.uuid4())[:8]
+            approval_id = token_hex(4)
+            now = time.time()
 
             # Create approval request
             approval = PendingApproval(
@@ -401,15 +526,15 @@ class SimpleChoresCoordinator:
                 kid_id=chore.kid_id,
                 title=chore.title,
                 points=chore.points,
-                completed_ts=datetime.now().timestamp()
+                completed_ts=now
             )
 
             # Update chore status
             chore.status = "completed"
-            chore.completed_ts = datetime.now().timestamp()
+            chore.completed_ts = now
 
-            self.model.pending_approvals[approval_id] = approval
-            await self.async_save()
+            self.add_approval(approval)
+            self.async_schedule_save()
 
             # Update approval buttons (with error handling for tests)
             try:
@@ -438,18 +563,18 @@ class SimpleChoresCoordinator:
             if approval.todo_uid in self.model.pending_chores:
                 chore_type = self.model.pending_chores[approval.todo_uid].chore_type
             
-            completed_date = datetime.now().strftime("%Y-%m-%d")
-            achieved_rewards = await self.update_reward_progress(approval.kid_id, chore_type, completed_date)
+            now = datetime.now()
+            completed_date = now.strftime("%Y-%m-%d")
+            await self.update_reward_progress(approval.kid_id, chore_type, completed_date)
 
             # Update approval status
-            approval.status = "approved"
+            self.model.set_approval_status(approval_id, "approved")
+            self._approvals_version += 1
 
             # Update original chore status
             if approval.todo_uid in self.model.pending_chores:
                 self.model.pending_chores[approval.todo_uid].status = "approved"
-                self.model.pending_chores[approval.todo_uid].approved_ts = datetime.now().timestamp()
-
-            await self.async_save()
+                self.model.pending_chores[approval.todo_uid].approved_ts = now.timestamp()
             return True
         return False
 
@@ -461,13 +586,14 @@ class SimpleChoresCoordinator:
             approval = self.model.pending_approvals[approval_id]
 
             # Update approval status
-            approval.status = "rejected"
+            self.model.set_approval_status(approval_id, "rejected")
+            self._approvals_version += 1
 
             # Update original chore status
             if approval.todo_uid in self.model.pending_chores:
                 self.model.pending_chores[approval.todo_uid].status = "rejected"
 
-            await self.async_save()
+            self.async_schedule_save()
 
             # Update approval buttons (with error handling for tests)
             try:
@@ -498,35 +624,37 @@ class SimpleChoresCoordinator:
                 _LOGGER.warning("Failed to create dynamic approval buttons for %s: %s", approval_id, ex)
 
     async def _update_approval_buttons(self):
-        """Trigger updates for all dynamic buttons and sensors"""
-        # Update approval status buttons
-        if hasattr(self, '_approval_buttons'):
-            for button in self._approval_buttons:
-                button.async_write_ha_state()
-
-        # Update dynamic claim buttons
-        if hasattr(self, '_claim_buttons'):
-            for button in self._claim_buttons:
-                button.async_write_ha_state()
-                
-        # Update individual claim buttons
-        if hasattr(self, '_individual_claim_buttons'):
-            for button in self._individual_claim_buttons:
-                button.async_write_ha_state()
-                
-        # Update dynamic approval management buttons
-        if hasattr(self, '_approval_manager_buttons'):
-            for button in self._approval_manager_buttons:
-                button.async_write_ha_state()
+        """Signal approval/claim buttons and sensors to refresh their state"""
+        async_dispatcher_send(self.hass, SIGNAL_APPROVALS_UPDATED)
+
+    def add_approval(self, approval: PendingApproval) -> None:
+        """Store an approval request and track it while it awaits a decision."""
+        self.model.add_approval(approval)
+        self._approvals_version += 1
 
-        # Update sensors
-        if hasattr(self, '_approval_sensors'):
-            for sensor in self._approval_sensors:
-                sensor.async_write_ha_state()
+    def remove_approval(self, approval_id: str) -> PendingApproval | None:
+        """Remove an approval request in any state."""
+        self._approvals_version += 1
+        return self.model.remove_approval(approval_id)
+
+    @property
+    def approvals_version(self) -> int:
+        """Counter bumped whenever an approval is added, removed or decided."""
+        return self._approvals_version
 
     def get_pending_approvals(self) -> list[PendingApproval]:
-        """Get all pending approval requests"""
-        return [a for a in self.model.pending_approvals.values() if a.status == "pending_approval"]
+        """Get all pending approval requests.
+
+        The list is shared between callers until the approvals change, so it
+        must not be mutated.
+        """
+        # The index is a new dict whenever the model had to rebuild it
+        active = self.model.active_approvals
+        cache = self._pending_approvals_cache
+        if cache is None or cache[0] is not active or cache[1] != self._approvals_version:
+            cache = (active, self._approvals_version, list(active.values()))
+            self._pending_approvals_cache = cache
+        return cache[2]
 
     def get_pending_approval(self, approval_id: str):
         """Get a specific pending approval by ID"""
@@ -538,38 +666,43 @@ class SimpleChoresCoordinator:
     async def save_todo_item(self, uid: str, summary: str, status: str, kid_id: str, skip_save: bool = False) -> None:
         """Save a todo item to persistent storage"""
         assert self.model
-        
-        # Remove existing item with same UID
-        self.model.todo_items = [item for item in self.model.todo_items if item.uid != uid]
-        
-        # Add new/updated item
-        todo_item = TodoItemModel(
-            uid=uid,
-            summary=summary,
-            status=status,
-            kid_id=kid_id
-        )
-        self.model.todo_items.append(todo_item)
+
+        key = self._norm(kid_id)
+        existing = self.model.todo_items.get(uid)
+        if existing is not None and self._norm(existing.kid_id) == key:
+            # Update in place; both the dict and the kid index hold this object
+            existing.summary = summary
+            existing.status = status
+        else:
+            # Add a new item; this also moves the index entry if the kid changed
+            self.model.put_todo_item(TodoItemModel(
+                uid=uid,
+                summary=summary,
+                status=status,
+                kid_id=kid_id
+            ))
         if not skip_save:
-            await self.async_save()
+            self.async_schedule_save()
 
     async def remove_todo_item(self, uid: str) -> None:
         """Remove a todo item from persistent storage"""
+        await self.remove_todo_items((uid,))
+
+    async def remove_todo_items(self, uids: Iterable[str]) -> None:
+        """Remove todo items from persistent storage with a single save"""
         assert self.model
-        self.model.todo_items = [item for item in self.model.todo_items if item.uid != uid]
-        await self.async_save()
+        for uid in uids:
+            self.model.remove_todo_item(uid)
+        self.async_schedule_save()
 
     def get_todo_items_for_kid(self, kid_id: str) -> list[TodoItemModel]:
         """Get all stored todo items for a specific kid"""
         if not self.model:
             return []
-        return [item for item in self.model.todo_items if item.kid_id == kid_id]
+        return list(self.model.todo_items_by_kid.get(self._norm(kid_id), {}).values())
 
     def get_todo_item(self, uid: str) -> TodoItemModel | None:
         """Get a specific todo item by UID"""
         if not self.model:
             return None
-        for item in self.model.todo_items:
-            if item.uid == uid:
-                return item
-        return None
+        return self.model.todo_items.get(uid)
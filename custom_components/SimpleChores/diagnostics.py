@@ -1,6 +1,7 @@
 """Diagnostics support for SimpleChores integration."""
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -19,18 +20,10 @@ async def async_get_config_entry_diagnostics(
     if not coordinator.model:
         return {"error": "Coordinator model not initialized"}
 
-    # Calculate some useful statistics
-    total_points_earned = sum(
-        ledger_entry.delta 
-        for ledger_entry in coordinator.model.ledger 
-        if ledger_entry.delta > 0
-    )
-    
-    total_points_spent = sum(
-        abs(ledger_entry.delta) 
-        for ledger_entry in coordinator.model.ledger 
-        if ledger_entry.delta < 0
-    )
+    # Calculate some useful statistics from the model's ledger aggregates
+    model = coordinator.model
+    total_points_earned = model.total_points_earned()
+    total_points_spent = model.total_points_spent()
     
     # Get recent activity (last 10 ledger entries)
     recent_activity = []
@@ -44,15 +37,8 @@ async def async_get_config_entry_diagnostics(
         })
     
     # Count items by status
-    pending_chores_by_status = {}
-    for chore in coordinator.model.pending_chores.values():
-        status = chore.status
-        pending_chores_by_status[status] = pending_chores_by_status.get(status, 0) + 1
-    
-    approvals_by_status = {}
-    for approval in coordinator.model.pending_approvals.values():
-        status = approval.status
-        approvals_by_status[status] = approvals_by_status.get(status, 0) + 1
+    pending_chores_by_status = dict(Counter(chore.status for chore in coordinator.model.pending_chores.values()))
+    approvals_by_status = dict(Counter(approval.status for approval in coordinator.model.pending_approvals.values()))
 
     return {
         "integration_version": "1.3.0",
@@ -78,23 +64,16 @@ async def async_get_config_entry_diagnostics(
             kid.id: {
                 "name": kid.name,
                 "current_points": kid.points,
-                "points_earned": sum(
-                    ledger_entry.delta for ledger_entry in coordinator.model.ledger 
-                    if ledger_entry.kid_id == kid.id and ledger_entry.delta > 0
-                ),
-                "points_spent": sum(
-                    abs(ledger_entry.delta) for ledger_entry in coordinator.model.ledger 
-                    if ledger_entry.kid_id == kid.id and ledger_entry.delta < 0
-                )
+                "points_earned": model.points_earned(kid.id),
+                "points_spent": model.points_spent(kid.id)
             }
             for kid in coordinator.model.kids.values()
         },
         "recent_activity": recent_activity,
         "entity_registry": {
-            "has_number_entities": hasattr(coordinator, '_entities'),
-            "has_todo_entities": hasattr(coordinator, '_todo_entities'),
-            "has_approval_buttons": hasattr(coordinator, '_approval_buttons'),
-            "registered_entities_count": len(getattr(coordinator, '_entities', {}))
+            "has_number_entities": bool(coordinator._entities),
+            "has_todo_entities": bool(coordinator._todo_entities),
+            "registered_entities_count": len(coordinator._entities)
         },
         "storage_status": {
             "model_loaded": coordinator.model is not None,
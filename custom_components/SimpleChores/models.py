@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+import sys
+import time
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Kid:
     id: str
     name: str
     points: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
     ts: float
     kid_id: str
@@ -19,7 +22,12 @@ class LedgerEntry:
     reason: str
     kind: str  # "earn" | "spend" | "adjust"
 
-@dataclass
+    def __post_init__(self) -> None:
+        # Stored under the lowercase kid key the coordinator uses; a long
+        # ledger repeats a handful of kid ids, so share one string per kid
+        self.kid_id = sys.intern(self.kid_id.lower())
+
+@dataclass(slots=True)
 class Reward:
     id: str
     title: str
@@ -32,20 +40,32 @@ class Reward:
     required_completions: int | None = None  # Complete X times
     required_streak_days: int | None = None  # Daily streak for X days
     required_chore_type: str | None = None  # Specific chore type for completions/streaks
-    
+
+    # Derived (not persisted): "point" | "completion" | "streak" | "none",
+    # in the same precedence the reward handlers check the requirements
+    reward_type: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reward_type = (
+            "point" if self.cost is not None
+            else "completion" if self.required_completions is not None
+            else "streak" if self.required_streak_days is not None
+            else "none"
+        )
+
     def is_point_based(self) -> bool:
         """Check if this is a point-based reward."""
-        return self.cost is not None
+        return self.reward_type == "point"
     
     def is_completion_based(self) -> bool:
         """Check if this is a completion-based reward."""
-        return self.required_completions is not None
+        return self.reward_type == "completion"
     
     def is_streak_based(self) -> bool:
         """Check if this is a streak-based reward."""
-        return self.required_streak_days is not None
+        return self.reward_type == "streak"
 
-@dataclass
+@dataclass(slots=True)
 class PendingChore:
     """Tracks chores created via create_adhoc_chore with their point values"""
     todo_uid: str
@@ -58,7 +78,7 @@ class PendingChore:
     approved_ts: float | None = None
     chore_type: str | None = None  # For reward tracking (e.g., "trash", "dishes", "bed")
 
-@dataclass
+@dataclass(slots=True)
 class RecurringChore:
     """Defines a recurring chore template"""
     id: str
@@ -71,7 +91,7 @@ class RecurringChore:
     created_ts: float = field(default_factory=lambda: datetime.now().timestamp())
     chore_type: str | None = None  # For reward tracking (e.g., "trash", "dishes", "bed")
 
-@dataclass
+@dataclass(slots=True)
 class PendingApproval:
     """Tracks chores waiting for parental approval"""
     id: str
@@ -82,7 +102,7 @@ class PendingApproval:
     completed_ts: float
     status: str = "pending_approval"  # "pending_approval" | "approved" | "rejected"
 
-@dataclass
+@dataclass(slots=True)
 class TodoItemModel:
     """Serializable representation of a TodoItem for storage"""
     uid: str
@@ -91,7 +111,7 @@ class TodoItemModel:
     kid_id: str  # Which kid this todo item belongs to
     created_ts: float = field(default_factory=lambda: datetime.now().timestamp())
 
-@dataclass
+@dataclass(slots=True)
 class RewardProgress:
     """Tracks a child's progress towards a specific reward"""
     kid_id: str
@@ -116,5 +136,258 @@ class StorageModel:
     pending_chores: dict[str, PendingChore] = field(default_factory=dict)  # key: todo_uid
     recurring_chores: dict[str, RecurringChore] = field(default_factory=dict)  # key: chore_id
     pending_approvals: dict[str, PendingApproval] = field(default_factory=dict)  # key: approval_id
-    todo_items: list[TodoItemModel] = field(default_factory=list)  # persistent todo items
+    todo_items: dict[str, TodoItemModel] = field(default_factory=dict)  # key: uid
     reward_progress: dict[str, RewardProgress] = field(default_factory=dict)  # key: f"{kid_id}_{reward_id}"
+    # Derived indexes (not persisted): collection name -> (collection, its size,
+    # lowercase kid_id -> {key: item}); see _kid_index
+    _kid_indexes: dict[str, tuple[dict, int, dict[str, dict[str, Any]]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (pending_approvals, its size, approvals still awaiting a decision); see active_approvals
+    _active_approvals: tuple[dict, int, dict[str, PendingApproval]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Derived ledger aggregates (not persisted), keyed by lowercase kid_id and
+    # folded in incrementally as entries are appended; see _sync_ledger_totals
+    earned_by_kid: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    spent_by_kid: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    week_net: dict[tuple[str, int, int], int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _totals_ledger: list[LedgerEntry] | None = field(default=None, init=False, repr=False, compare=False)
+    _totals_len: int = field(default=0, init=False, repr=False, compare=False)
+    # (start_ts, end_ts, iso_year, iso_week) of the last week looked up
+    _week_span: tuple[float, float, int, int] | None = field(default=None, init=False, repr=False, compare=False)
+    # (pending_approvals, its size, todo_uid -> approval ids); see _approvals_by_todo_index
+    _approvals_by_todo: tuple[dict, int, dict[str, list[str]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _kid_index(self, name: str) -> dict[str, dict[str, Any]]:
+        """Return the lowercase kid_id -> {key: item} index of a model collection.
+
+        Built on first use, kept current by the add/remove helpers below, and
+        rebuilt whenever the collection is replaced or changes size behind
+        their back.
+        """
+        source = getattr(self, name)
+        index = self._kid_indexes.get(name)
+        if index is None or index[0] is not source or index[1] != len(source):
+            by_kid: dict[str, dict[str, Any]] = {}
+            for key, item in source.items():
+                by_kid.setdefault(item.kid_id.lower(), {})[key] = item
+            index = (source, len(source), by_kid)
+            self._kid_indexes[name] = index
+        return index[2]
+
+    def _kid_index_put(self, name: str, key: str, item: Any) -> None:
+        """Insert or replace an item in a kid-indexed collection."""
+        source = getattr(self, name)
+        by_kid = self._kid_index(name)
+        old = source.get(key)
+        if old is not None:
+            by_kid.get(old.kid_id.lower(), {}).pop(key, None)
+        source[key] = item
+        by_kid.setdefault(item.kid_id.lower(), {})[key] = item
+        self._kid_indexes[name] = (source, len(source), by_kid)
+
+    def _kid_index_pop(self, name: str, key: str) -> Any:
+        """Remove an item from a kid-indexed collection and return it, or None."""
+        source = getattr(self, name)
+        by_kid = self._kid_index(name)
+        item = source.pop(key, None)
+        if item is not None:
+            by_kid.get(item.kid_id.lower(), {}).pop(key, None)
+        self._kid_indexes[name] = (source, len(source), by_kid)
+        return item
+
+    @property
+    def todo_items_by_kid(self) -> dict[str, dict[str, TodoItemModel]]:
+        """Stored todo items by lowercase kid_id, in insertion order."""
+        return self._kid_index("todo_items")
+
+    @property
+    def pending_by_kid(self) -> dict[str, dict[str, PendingChore]]:
+        """Pending chores by lowercase kid_id, in insertion order."""
+        return self._kid_index("pending_chores")
+
+    @property
+    def recurring_by_kid(self) -> dict[str, dict[str, RecurringChore]]:
+        """Recurring chores by lowercase kid_id, in insertion order."""
+        return self._kid_index("recurring_chores")
+
+    def add_pending_chore(self, chore: PendingChore) -> None:
+        """Store a pending chore under its todo_uid."""
+        self._kid_index_put("pending_chores", chore.todo_uid, chore)
+
+    def remove_pending_chore(self, todo_uid: str) -> PendingChore | None:
+        """Remove a pending chore and return it, or None."""
+        return self._kid_index_pop("pending_chores", todo_uid)
+
+    def add_recurring_chore(self, chore: RecurringChore) -> None:
+        """Store a recurring chore template under its id."""
+        self._kid_index_put("recurring_chores", chore.id, chore)
+
+    def put_todo_item(self, item: TodoItemModel) -> None:
+        """Store a todo item under its uid, replacing any previous one."""
+        self._kid_index_put("todo_items", item.uid, item)
+
+    def remove_todo_item(self, uid: str) -> TodoItemModel | None:
+        """Remove a stored todo item and return it, or None."""
+        return self._kid_index_pop("todo_items", uid)
+
+    def _sync_ledger_totals(self) -> None:
+        """Fold ledger entries appended since the last read into the aggregates.
+
+        The ledger is append-only, so only the new tail is visited. If the list
+        was replaced or shrank, the aggregates are rebuilt from scratch.
+        """
+        ledger = self.ledger
+        if ledger is not self._totals_ledger or len(ledger) < self._totals_len:
+            self.earned_by_kid.clear()
+            self.spent_by_kid.clear()
+            self.week_net.clear()
+            self._totals_ledger = ledger
+            self._totals_len = 0
+        # LedgerEntry lowercases kid_id on construction
+        for entry in ledger[self._totals_len:]:
+            kid = entry.kid_id
+            if entry.delta > 0:
+                self.earned_by_kid[kid] = self.earned_by_kid.get(kid, 0) + entry.delta
+            elif entry.delta < 0:
+                self.spent_by_kid[kid] = self.spent_by_kid.get(kid, 0) - entry.delta
+            week_key = (kid, *self._iso_week(entry.ts))
+            self.week_net[week_key] = self.week_net.get(week_key, 0) + entry.delta
+        self._totals_len = len(ledger)
+
+    def _iso_week(self, ts: float) -> tuple[int, int]:
+        """Return (iso_year, iso_week) for a timestamp.
+
+        Consecutive lookups almost always land in the same week, so the
+        boundaries of the last week seen are kept and reused.
+        """
+        span = self._week_span
+        if span is None or not span[0] <= ts < span[1]:
+            day = datetime.fromtimestamp(ts).replace(hour=0, minute=0, second=0, microsecond=0)
+            monday = day - timedelta(days=day.weekday())
+            iso_year, iso_week, _ = monday.isocalendar()
+            span = (monday.timestamp(), (monday + timedelta(days=7)).timestamp(), iso_year, iso_week)
+            self._week_span = span
+        return span[2], span[3]
+
+    @property
+    def active_approvals(self) -> dict[str, PendingApproval]:
+        """Approvals still awaiting a decision, by approval id.
+
+        Kept current by add_approval, remove_approval and set_approval_status;
+        rebuilt whenever pending_approvals is replaced or changes size behind
+        their back.
+        """
+        approvals = self.pending_approvals
+        index = self._active_approvals
+        if index is None or index[0] is not approvals or index[1] != len(approvals):
+            active = {aid: a for aid, a in approvals.items() if a.status == "pending_approval"}
+            index = (approvals, len(approvals), active)
+            self._active_approvals = index
+        return index[2]
+
+    def add_approval(self, approval: PendingApproval) -> None:
+        """Store an approval request, replacing any request with the same id."""
+        # Bring both indexes current before touching pending_approvals, so the
+        # stored sizes below only ever describe a mutation made here
+        active = self.active_approvals
+        by_todo = self._approvals_by_todo_index()
+        approvals = self.pending_approvals
+        replaced = approvals.get(approval.id)
+        if replaced is not None:
+            self._unindex_todo_approval(by_todo, approval.id, replaced.todo_uid)
+        approvals[approval.id] = approval
+        by_todo.setdefault(approval.todo_uid, []).append(approval.id)
+        if approval.status == "pending_approval":
+            active[approval.id] = approval
+        else:
+            # The request it replaces may have been awaiting a decision
+            active.pop(approval.id, None)
+        self._active_approvals = (approvals, len(approvals), active)
+        self._approvals_by_todo = (approvals, len(approvals), by_todo)
+
+    def remove_approval(self, approval_id: str) -> PendingApproval | None:
+        """Remove an approval request in any state and return it, or None."""
+        active = self.active_approvals
+        by_todo = self._approvals_by_todo_index()
+        approvals = self.pending_approvals
+        approval = approvals.pop(approval_id, None)
+        active.pop(approval_id, None)
+        if approval is not None:
+            self._unindex_todo_approval(by_todo, approval_id, approval.todo_uid)
+        self._active_approvals = (approvals, len(approvals), active)
+        self._approvals_by_todo = (approvals, len(approvals), by_todo)
+        return approval
+
+    def set_approval_status(self, approval_id: str, status: str) -> PendingApproval | None:
+        """Record a decision on an approval request and return it, or None."""
+        approval = self.pending_approvals.get(approval_id)
+        if approval is None:
+            return None
+        active = self.active_approvals
+        approval.status = status
+        if status == "pending_approval":
+            active[approval_id] = approval
+        else:
+            active.pop(approval_id, None)
+        return approval
+
+    def approval_ids_for_todo(self, todo_uid: str) -> list[str]:
+        """Ids of the approval requests, in any state, raised for a todo item."""
+        # A copy, so callers can remove approvals while iterating the result
+        return list(self._approvals_by_todo_index().get(todo_uid, ()))
+
+    def _approvals_by_todo_index(self) -> dict[str, list[str]]:
+        """Return the todo_uid -> approval ids index of pending_approvals.
+
+        Built on first use, kept current by add_approval/remove_approval, and
+        rebuilt whenever pending_approvals is replaced or changes size behind
+        their back.
+        """
+        approvals = self.pending_approvals
+        index = self._approvals_by_todo
+        if index is None or index[0] is not approvals or index[1] != len(approvals):
+            by_todo: dict[str, list[str]] = {}
+            for approval_id, approval in approvals.items():
+                by_todo.setdefault(approval.todo_uid, []).append(approval_id)
+            index = (approvals, len(approvals), by_todo)
+            self._approvals_by_todo = index
+        return index[2]
+
+    @staticmethod
+    def _unindex_todo_approval(by_todo: dict[str, list[str]], approval_id: str, todo_uid: str) -> None:
+        """Drop an approval from the todo_uid index."""
+        ids = by_todo.get(todo_uid)
+        if ids is not None and approval_id in ids:
+            ids.remove(approval_id)
+            if not ids:
+                del by_todo[todo_uid]
+
+    def points_earned(self, kid_id: str) -> int:
+        """Total points a kid has earned."""
+        self._sync_ledger_totals()
+        return self.earned_by_kid.get(kid_id.lower(), 0)
+
+    def points_spent(self, kid_id: str) -> int:
+        """Total points a kid has spent or had removed."""
+        self._sync_ledger_totals()
+        return self.spent_by_kid.get(kid_id.lower(), 0)
+
+    def total_points_earned(self) -> int:
+        """Total points earned across all kids."""
+        self._sync_ledger_totals()
+        return sum(self.earned_by_kid.values())
+
+    def total_points_spent(self) -> int:
+        """Total points spent or removed across all kids."""
+        self._sync_ledger_totals()
+        return sum(self.spent_by_kid.values())
+
+    def week_points(self, kid_id: str, when: datetime | None = None) -> int:
+        """Net points for a kid in the ISO week (Monday to Sunday) containing when."""
+        self._sync_ledger_totals()
+        ts = when.timestamp() if when else time.time()
+        return self.week_net.get((kid_id.lower(), *self._iso_week(ts)), 0)
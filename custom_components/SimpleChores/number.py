@@ -1,24 +1,27 @@
 """Number entities for SimpleChores integration."""
 from __future__ import annotations
 
+import logging
+
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .const import CONF_KIDS, DEFAULT_KIDS, DOMAIN
+from .coordinator import SimpleChoresCoordinator, parse_kids
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entities: AddEntitiesCallback):
     coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    kids_csv = entry.data.get("kids", "alex,emma")
-    kids = [k.strip() for k in kids_csv.split(",") if k.strip()]
-    entities = []
+    kids = parse_kids(entry.data.get(CONF_KIDS, DEFAULT_KIDS))
+    # ensure_kid only touches the in-memory model and schedules a debounced
+    # save, so awaiting it in sequence never actually suspends
     for kid in kids:
         await coordinator.ensure_kid(kid, kid.capitalize())
-        entities.append(SimpleChoresNumber(coordinator, kid))
-    add_entities(entities, True)
+    add_entities([SimpleChoresNumber(coordinator, kid) for kid in kids], True)
 
 class SimpleChoresNumber(NumberEntity):
     _attr_native_min_value = 0
@@ -31,29 +34,21 @@ class SimpleChoresNumber(NumberEntity):
         self._attr_unique_id = f"{DOMAIN}_{kid_id}_points"
         self._attr_name = f"{kid_id.capitalize()} Points"
         # Store reference in coordinator for updates
-        if not hasattr(coord, '_entities'):
-            coord._entities = {}
-        coord._entities[kid_id] = self
+        coord.register_entity(kid_id, self)
 
     @property
     def native_value(self) -> float | None:
         points = self._coord.get_points(self._kid_id)
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: Number entity {self._kid_id} reporting {points} points")
+        _LOGGER.debug("SimpleChores: Number entity %s reporting %s points", self._kid_id, points)
         return float(points)
 
     async def async_set_native_value(self, value: float) -> None:
-        current = self._coord.get_points(self._kid_id)
-        delta = int(value) - current
-        if delta != 0:
-            if delta > 0:
-                await self._coord.add_points(self._kid_id, delta, "Manual adjust", "adjust")
-            else:
-                await self._coord.remove_points(self._kid_id, -delta, "Manual adjust", "adjust")
-        self.async_write_ha_state()
-        # Update all number entities for this kid
-        self.async_schedule_update_ha_state(force_refresh=True)
+        delta = int(value) - self._coord.get_points(self._kid_id)
+        if delta:
+            # add_points takes signed deltas and writes this entity's state itself
+            await self._coord.add_points(self._kid_id, delta, "Manual adjust", "adjust")
+        else:
+            self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Called by Home Assistant to update the entity."""
@@ -1,32 +1,36 @@
 """Sensor entities for SimpleChores integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .const import CONF_KIDS, DEFAULT_KIDS, DOMAIN, SIGNAL_APPROVALS_UPDATED
+from .coordinator import SimpleChoresCoordinator, parse_kids
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entities: AddEntitiesCallback):
     coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    kids_csv = entry.data.get("kids", "alex,emma")
-    kids = [k.strip() for k in kids_csv.split(",") if k.strip()]
+    kids = parse_kids(entry.data.get(CONF_KIDS, DEFAULT_KIDS))
 
-    entities = []
-    for kid in kids:
-        entities.append(SimpleChoresWeekSensor(coordinator, kid))
-        entities.append(SimpleChoresTotalSensor(coordinator, kid))
-        
-        # Add reward progress sensors for each kid
-        rewards = coordinator.get_rewards()
-        for reward in rewards:
-            if not reward.is_point_based():  # Only create progress sensors for completion/streak rewards
-                entities.append(SimpleChoresRewardProgressSensor(coordinator, kid, reward))
+    # Only completion/streak rewards get progress sensors
+    progress_rewards = [r for r in coordinator.get_rewards() if not r.is_point_based()]
+
+    entities = [
+        sensor
+        for kid in kids
+        for sensor in (
+            SimpleChoresWeekSensor(coordinator, kid),
+            SimpleChoresTotalSensor(coordinator, kid),
+            # Add reward progress sensors for each kid
+            *(SimpleChoresRewardProgressSensor(coordinator, kid, reward) for reward in progress_rewards),
+        )
+    ]
 
     # Add pending approvals sensor
     entities.append(SimpleChoresPendingApprovalsSensor(coordinator))
@@ -34,20 +38,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entitie
     add_entities(entities, True)
 
 class SimpleChoresWeekSensor(SensorEntity):
+    # Pushed by the coordinator on ledger changes instead of polled
+    _attr_should_poll = False
+
     def __init__(self, coord: SimpleChoresCoordinator, kid_id: str):
         self._coord = coord
         self._kid_id = kid_id
         self._attr_unique_id = f"{DOMAIN}_{kid_id}_points_week"
         self._attr_name = f"SimpleChores {kid_id.capitalize()} Points (This Week)"
 
+    async def async_added_to_hass(self) -> None:
+        """Refresh state on new ledger entries and when the week rolls over."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._coord.async_add_kid_listener(self._kid_id, self.async_write_ha_state))
+        self.async_on_remove(
+            async_track_time_change(self.hass, self._async_midnight, hour=0, minute=0, second=0)
+        )
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        if now.weekday() == 0:
+            self.async_write_ha_state()
+
     @property
     def native_value(self):
-        # simple derived value from ledger
+        # Net points since Monday 00:00, from the model's ledger aggregates
         model = self._coord.model
-        if not model or not model.ledger:
+        if not model:
             return 0
-        monday = (datetime.now() - timedelta(days=datetime.now().weekday())).timestamp()
-        return sum(e.delta for e in model.ledger if e.kid_id == self._kid_id and e.ts >= monday)
+        return model.week_points(self._kid_id)
 
     @property
     def available(self) -> bool:
@@ -55,6 +74,8 @@ class SimpleChoresWeekSensor(SensorEntity):
         return self._coord.model is not None
 
 class SimpleChoresTotalSensor(SensorEntity):
+    _attr_should_poll = False
+
     def __init__(self, coord: SimpleChoresCoordinator, kid_id: str):
         self._coord = coord
         self._kid_id = kid_id
@@ -62,13 +83,18 @@ class SimpleChoresTotalSensor(SensorEntity):
         self._attr_name = f"SimpleChores {kid_id.capitalize()} Points (Total Earned)"
         self._attr_icon = "mdi:star-circle-outline"
 
+    async def async_added_to_hass(self) -> None:
+        """Refresh state on new ledger entries."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._coord.async_add_kid_listener(self._kid_id, self.async_write_ha_state))
+
     @property
     def native_value(self):
         # Total points earned (not current balance)
         model = self._coord.model
-        if not model or not model.ledger:
+        if not model:
             return 0
-        return sum(e.delta for e in model.ledger if e.kid_id == self._kid_id and e.delta > 0)
+        return model.points_earned(self._kid_id)
 
     @property
     def available(self) -> bool:
@@ -81,10 +107,15 @@ class SimpleChoresPendingApprovalsSensor(SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_pending_approvals"
         self._attr_name = "SimpleChores Pending Chore Approvals"
         self._attr_icon = "mdi:clipboard-check-multiple"
-        # Store reference in coordinator for updates
-        if not hasattr(coord, '_approval_sensors'):
-            coord._approval_sensors = []
-        coord._approval_sensors.append(self)
+        # (model, approvals version, attributes) from the last attributes read
+        self._attr_cache: tuple[object, int, dict] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh state whenever the coordinator signals a change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_APPROVALS_UPDATED, self.async_write_ha_state)
+        )
 
     @property
     def native_value(self):
@@ -96,9 +127,15 @@ class SimpleChoresPendingApprovalsSensor(SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the pending approvals as attributes."""
-        if not self._coord.model:
+        model = self._coord.model
+        if not model:
             return {}
 
+        version = self._coord.approvals_version
+        cache = self._attr_cache
+        if cache is not None and cache[0] is model and cache[1] == version:
+            return cache[2]
+
         pending_approvals = self._coord.get_pending_approvals()
         attributes = {
             "count": len(pending_approvals),
@@ -118,6 +155,7 @@ class SimpleChoresPendingApprovalsSensor(SensorEntity):
                 "reject_data": {"approval_id": approval.id, "reason": "Not done properly"}
             })
 
+        self._attr_cache = (model, version, attributes)
         return attributes
 
     @property
@@ -142,6 +180,8 @@ class SimpleChoresRewardProgressSensor(SensorEntity):
         else:  # streak-based
             self._attr_icon = "mdi:calendar-check"
             self._attr_unit_of_measurement = "days"
+        # (progress snapshot, attributes) from the last attributes read
+        self._attr_cache: tuple[tuple | None, dict] | None = None
 
     @property
     def native_value(self):
@@ -159,7 +199,16 @@ class SimpleChoresRewardProgressSensor(SensorEntity):
     def extra_state_attributes(self):
         """Return detailed progress information."""
         progress = self._coord.get_reward_progress(self._kid_id, self._reward.id)
-        
+        key = None if not progress else (
+            progress.current_completions,
+            progress.current_streak,
+            progress.last_completion_date,
+            progress.completed,
+            progress.completion_date,
+        )
+        if self._attr_cache is not None and self._attr_cache[0] == key:
+            return self._attr_cache[1]
+
         attributes = {
             "reward_id": self._reward.id,
             "reward_title": self._reward.title,
@@ -171,7 +220,8 @@ class SimpleChoresRewardProgressSensor(SensorEntity):
             "progress_percentage": 0
         }
         
-        if self._reward.is_completion_based():
+        reward_type = self._reward.reward_type
+        if reward_type == "completion":
             attributes.update({
                 "reward_type": "completion",
                 "required_completions": self._reward.required_completions,
@@ -182,7 +232,7 @@ class SimpleChoresRewardProgressSensor(SensorEntity):
             if self._reward.required_completions:
                 attributes["progress_percentage"] = int((progress.current_completions if progress else 0) / self._reward.required_completions * 100)
                 
-        elif self._reward.is_streak_based():
+        elif reward_type == "streak":
             attributes.update({
                 "reward_type": "streak",
                 "required_streak_days": self._reward.required_streak_days,
@@ -197,7 +247,8 @@ class SimpleChoresRewardProgressSensor(SensorEntity):
         if progress:
             attributes["completed"] = progress.completed
             attributes["completion_date"] = progress.completion_date
-            
+
+        self._attr_cache = (key, attributes)
         return attributes
 
     @property
@@ -1,28 +1,77 @@
 """Storage utilities for SimpleChores integration."""
 from __future__ import annotations
 
+from dataclasses import fields
+from functools import cache
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
 from .const import STORAGE_KEY, STORAGE_VERSION
-from .models import Kid, LedgerEntry, PendingChore, Reward, StorageModel, TodoItemModel
+from .models import Kid, LedgerEntry, PendingApproval, PendingChore, RecurringChore, Reward, StorageModel, TodoItemModel
+
+
+@cache
+def _persisted_fields(cls: type) -> tuple[str, ...]:
+    """Return the constructor fields of a model class; derived fields are skipped."""
+    return tuple(f.name for f in fields(cls) if f.init)
+
+
+def _as_dict(obj) -> dict:
+    """Return the persisted fields of a model dataclass as a plain dict."""
+    return {name: getattr(obj, name) for name in _persisted_fields(type(obj))}
+
+
+def _ledger_from_columns(raw_ledger: dict) -> list[LedgerEntry]:
+    """Rebuild ledger entries from the column-wise layout, refusing partial data."""
+    names = _persisted_fields(LedgerEntry)
+    missing = [name for name in names if name not in raw_ledger]
+    if missing:
+        raise ValueError(f"Stored ledger is missing columns: {', '.join(missing)}")
+    columns = [raw_ledger[name] for name in names]
+    if len({len(column) for column in columns}) > 1:
+        lengths = ", ".join(f"{name}={len(column)}" for name, column in zip(names, columns, strict=True))
+        raise ValueError(f"Stored ledger columns differ in length: {lengths}")
+    return [LedgerEntry(*row) for row in zip(*columns, strict=True)]
+
+
+class _MigratingStore(Store[dict]):
+    """Store that upgrades data written by older versions of the integration."""
+
+    async def _async_migrate_func(self, old_major_version: int, old_minor_version: int, old_data: dict) -> dict:
+        if old_major_version < 3:
+            # Version 2 stored one dict per ledger entry; version 3 stores columns
+            raw_ledger = old_data.get("ledger", [])
+            if isinstance(raw_ledger, list):
+                old_data["ledger"] = {
+                    name: [entry[name] for entry in raw_ledger] for name in _persisted_fields(LedgerEntry)
+                }
+        return old_data
 
 
 class SimpleChoresStore:
     def __init__(self, hass: HomeAssistant):
-        self._store: Store[dict] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store: Store[dict] = _MigratingStore(hass, STORAGE_VERSION, STORAGE_KEY)
 
     async def async_load(self) -> StorageModel:
         data = await self._store.async_load() or {}
         kids = {k: Kid(**v) for k, v in data.get("kids", {}).items()}
-        ledger = [LedgerEntry(**e) for e in data.get("ledger", [])]
+        raw_ledger = data.get("ledger", [])
+        if isinstance(raw_ledger, dict):
+            # Ledger is stored column-wise: one list per LedgerEntry field
+            ledger = _ledger_from_columns(raw_ledger)
+        else:
+            # Older versions stored one dict per ledger entry
+            ledger = [LedgerEntry(**e) for e in raw_ledger]
         rewards = {k: Reward(**v) for k, v in data.get("rewards", {}).items()}
         pending_chores = {k: PendingChore(**v) for k, v in data.get("pending_chores", {}).items()}
-        # Handle missing fields for backwards compatibility
-        from .models import RecurringChore, PendingApproval
         recurring_chores = {k: RecurringChore(**v) for k, v in data.get("recurring_chores", {}).items()}
         pending_approvals = {k: PendingApproval(**v) for k, v in data.get("pending_approvals", {}).items()}
-        todo_items = [TodoItemModel(**e) for e in data.get("todo_items", [])]
+        raw_todo_items = data.get("todo_items", {})
+        if isinstance(raw_todo_items, list):
+            # Older versions stored todo items as a list
+            raw_todo_items = {e["uid"]: e for e in raw_todo_items}
+        todo_items = {k: TodoItemModel(**v) for k, v in raw_todo_items.items()}
         return StorageModel(
             kids=kids, 
             ledger=ledger, 
@@ -34,13 +83,15 @@ class SimpleChoresStore:
         )
 
     async def async_save(self, model: StorageModel) -> None:
+        # Store serializes with HA's orjson-based encoder
         data = {
-            "kids": {k: vars(v) for k, v in model.kids.items()},
-            "ledger": [vars(e) for e in model.ledger],
-            "rewards": {k: vars(v) for k, v in model.rewards.items()},
-            "pending_chores": {k: vars(v) for k, v in model.pending_chores.items()},
-            "recurring_chores": {k: vars(v) for k, v in model.recurring_chores.items()},
-            "pending_approvals": {k: vars(v) for k, v in model.pending_approvals.items()},
-            "todo_items": [vars(e) for e in model.todo_items],
+            "kids": {k: _as_dict(v) for k, v in model.kids.items()},
+            # Column-wise, so field names are not repeated for every entry
+            "ledger": {name: [getattr(e, name) for e in model.ledger] for name in _persisted_fields(LedgerEntry)},
+            "rewards": {k: _as_dict(v) for k, v in model.rewards.items()},
+            "pending_chores": {k: _as_dict(v) for k, v in model.pending_chores.items()},
+            "recurring_chores": {k: _as_dict(v) for k, v in model.recurring_chores.items()},
+            "pending_approvals": {k: _as_dict(v) for k, v in model.pending_approvals.items()},
+            "todo_items": {k: _as_dict(v) for k, v in model.todo_items.items()},
         }
         await self._store.async_save(data)
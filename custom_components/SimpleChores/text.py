@@ -1,194 +1,131 @@
 """Text input entities for SimpleChores integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .const import CONF_KIDS, DEFAULT_KIDS, DOMAIN, SCHEDULE_TYPES
+from .coordinator import SimpleChoresCoordinator, parse_kids
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entities: AddEntitiesCallback):
     coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    kids_csv = entry.data.get("kids", "alex,emma")
-    kids = [k.strip() for k in kids_csv.split(",") if k.strip()]
-
-    entities = []
-    # Add chore input helpers
-    entities.append(SimpleChoresChoreTitle(coordinator))
-    entities.append(SimpleChoresChorePoints(coordinator))
-    entities.append(SimpleChoresChoreKid(coordinator, kids))
-
-    # Add recurring chore input helpers
-    entities.append(SimpleChoresRecurringTitle(coordinator))
-    entities.append(SimpleChoresRecurringPoints(coordinator))
-    entities.append(SimpleChoresRecurringKid(coordinator, kids))
-    entities.append(SimpleChoresRecurringSchedule(coordinator))
-    entities.append(SimpleChoresRecurringDay(coordinator))
+    kids = parse_kids(entry.data.get(CONF_KIDS, DEFAULT_KIDS))
+
+    entities = [
+        # Chore input helpers
+        SimpleChoresChoreTitle(coordinator),
+        SimpleChoresChorePoints(coordinator),
+        SimpleChoresChoreKid(coordinator, kids),
+        # Recurring chore input helpers
+        SimpleChoresRecurringTitle(coordinator),
+        SimpleChoresRecurringPoints(coordinator),
+        SimpleChoresRecurringKid(coordinator, kids),
+        SimpleChoresRecurringSchedule(coordinator),
+        SimpleChoresRecurringDay(coordinator),
+    ]
 
     add_entities(entities, True)
 
-class SimpleChoresChoreTitle(TextEntity):
-    _attr_icon = "mdi:text"
-    _attr_native_min = 1
-    _attr_native_max = 100
-    _attr_mode = "text"
-
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_chore_title_input"
-        self._attr_name = "SimpleChores Chore Title"
-        self._attr_native_value = ""  # Start empty
-
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
 
-    async def async_set_value(self, value: str) -> None:
-        self._attr_native_value = value
-        self.async_write_ha_state()
+def _is_weekday(value: str) -> bool:
+    # A single character compare instead of int() inside try/except
+    return len(value) == 1 and "0" <= value <= "6"
 
-class SimpleChoresChorePoints(TextEntity):
-    _attr_icon = "mdi:star-circle"
-    _attr_pattern = r"^\d+$"
-    _attr_mode = "text"
 
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_chore_points_input"
-        self._attr_name = "SimpleChores Chore Points"
-        self._attr_native_value = "5"
+@dataclass(frozen=True, slots=True)
+class TextInputSpec:
+    """Static configuration of one text input helper."""
+    key: str  # unique_id suffix; the buttons look inputs up by it
+    name: str
+    icon: str
+    default: str = ""
+    pattern: str | None = None
+    native_min: int | None = None
+    native_max: int | None = None
+    kid_choice: bool = False  # Only accept configured kids; default to the first
+    validator: Callable[[str], bool] | None = None
 
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
 
-    async def async_set_value(self, value: str) -> None:
-        self._attr_native_value = value
-        self.async_write_ha_state()
-
-class SimpleChoresChoreKid(TextEntity):
-    _attr_icon = "mdi:account-child"
+class SimpleChoresTextInput(TextEntity):
+    """Text input helper whose behavior comes from its class's spec."""
     _attr_mode = "text"
-
-    def __init__(self, coord: SimpleChoresCoordinator, kids: list[str]):
-        self._coord = coord
-        self._kids = kids
-        self._attr_unique_id = f"{DOMAIN}_chore_kid_input"
-        self._attr_name = "SimpleChores Kid"
-        self._attr_native_value = kids[0] if kids else "noam"
-
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
-
-    async def async_set_value(self, value: str) -> None:
-        if value in self._kids:
-            self._attr_native_value = value
-            self.async_write_ha_state()
-
-# ---- Recurring Chore Input Entities ----
-
-class SimpleChoresRecurringTitle(TextEntity):
-    _attr_icon = "mdi:repeat"
-    _attr_native_min = 1
-    _attr_native_max = 100
-    _attr_mode = "text"
-
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_recurring_title_input"
-        self._attr_name = "SimpleChores Recurring Chore Title"
-        self._attr_native_value = "Brush teeth"
+    spec: TextInputSpec
+
+    def __init__(self, coord: SimpleChoresCoordinator, kids: Sequence[str] = ()):
+        # coord is accepted for parity with the other platforms; inputs keep no reference to it
+        spec = self.spec
+        self._kids = frozenset(kids)
+        self._attr_unique_id = f"{DOMAIN}_{spec.key}"
+        self._attr_name = spec.name
+        self._attr_icon = spec.icon
+        if spec.pattern is not None:
+            self._attr_pattern = spec.pattern
+        if spec.native_min is not None:
+            self._attr_native_min = spec.native_min
+        if spec.native_max is not None:
+            self._attr_native_max = spec.native_max
+        if spec.kid_choice:
+            self._attr_native_value = kids[0] if kids else "noam"
+        else:
+            self._attr_native_value = spec.default
 
     @property
     def native_value(self) -> str:
         return self._attr_native_value
 
     async def async_set_value(self, value: str) -> None:
+        spec = self.spec
+        if spec.kid_choice and value not in self._kids:
+            return
+        if spec.validator is not None and not spec.validator(value):
+            return
+        if value == self._attr_native_value:
+            return  # No state change to announce
         self._attr_native_value = value
         self.async_write_ha_state()
 
-class SimpleChoresRecurringPoints(TextEntity):
-    _attr_icon = "mdi:star-circle"
-    _attr_pattern = r"^\d+$"
-    _attr_mode = "text"
 
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_recurring_points_input"
-        self._attr_name = "SimpleChores Recurring Chore Points"
-        self._attr_native_value = "2"
+class SimpleChoresChoreTitle(SimpleChoresTextInput):
+    spec = TextInputSpec("chore_title_input", "SimpleChores Chore Title", "mdi:text",
+                         native_min=1, native_max=100)
 
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
 
-    async def async_set_value(self, value: str) -> None:
-        self._attr_native_value = value
-        self.async_write_ha_state()
+class SimpleChoresChorePoints(SimpleChoresTextInput):
+    spec = TextInputSpec("chore_points_input", "SimpleChores Chore Points", "mdi:star-circle",
+                         default="5", pattern=r"^\d+$")
 
-class SimpleChoresRecurringKid(TextEntity):
-    _attr_icon = "mdi:account-child"
-    _attr_mode = "text"
 
-    def __init__(self, coord: SimpleChoresCoordinator, kids: list[str]):
-        self._coord = coord
-        self._kids = kids
-        self._attr_unique_id = f"{DOMAIN}_recurring_kid_input"
-        self._attr_name = "SimpleChores Recurring Chore Kid"
-        self._attr_native_value = kids[0] if kids else "noam"
+class SimpleChoresChoreKid(SimpleChoresTextInput):
+    spec = TextInputSpec("chore_kid_input", "SimpleChores Kid", "mdi:account-child", kid_choice=True)
 
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
+# ---- Recurring Chore Input Entities ----
 
-    async def async_set_value(self, value: str) -> None:
-        if value in self._kids:
-            self._attr_native_value = value
-            self.async_write_ha_state()
+class SimpleChoresRecurringTitle(SimpleChoresTextInput):
+    spec = TextInputSpec("recurring_title_input", "SimpleChores Recurring Chore Title", "mdi:repeat",
+                         default="Brush teeth", native_min=1, native_max=100)
 
-class SimpleChoresRecurringSchedule(TextEntity):
-    _attr_icon = "mdi:calendar-clock"
-    _attr_mode = "text"
 
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_recurring_schedule_input"
-        self._attr_name = "SimpleChores Schedule Type"
-        self._attr_native_value = "daily"
+class SimpleChoresRecurringPoints(SimpleChoresTextInput):
+    spec = TextInputSpec("recurring_points_input", "SimpleChores Recurring Chore Points", "mdi:star-circle",
+                         default="2", pattern=r"^\d+$")
 
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
 
-    async def async_set_value(self, value: str) -> None:
-        if value in ["daily", "weekly"]:
-            self._attr_native_value = value
-            self.async_write_ha_state()
+class SimpleChoresRecurringKid(SimpleChoresTextInput):
+    spec = TextInputSpec("recurring_kid_input", "SimpleChores Recurring Chore Kid", "mdi:account-child",
+                         kid_choice=True)
 
-class SimpleChoresRecurringDay(TextEntity):
-    _attr_icon = "mdi:calendar-week"
-    _attr_pattern = r"^[0-6]$"
-    _attr_mode = "text"
 
-    def __init__(self, coord: SimpleChoresCoordinator):
-        self._coord = coord
-        self._attr_unique_id = f"{DOMAIN}_recurring_day_input"
-        self._attr_name = "SimpleChores Day of Week (0=Mon, 6=Sun)"
-        self._attr_native_value = "0"
+class SimpleChoresRecurringSchedule(SimpleChoresTextInput):
+    spec = TextInputSpec("recurring_schedule_input", "SimpleChores Schedule Type", "mdi:calendar-clock",
+                         default="daily", validator=SCHEDULE_TYPES.__contains__)
 
-    @property
-    def native_value(self) -> str:
-        return self._attr_native_value
 
-    async def async_set_value(self, value: str) -> None:
-        try:
-            day = int(value)
-            if 0 <= day <= 6:
-                self._attr_native_value = value
-                self.async_write_ha_state()
-        except ValueError:
-            pass
+class SimpleChoresRecurringDay(SimpleChoresTextInput):
+    spec = TextInputSpec("recurring_day_input", "SimpleChores Day of Week (0=Mon, 6=Sun)", "mdi:calendar-week",
+                         default="0", pattern=r"^[0-6]$", validator=_is_weekday)
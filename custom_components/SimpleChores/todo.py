@@ -1,7 +1,11 @@
 """Todo entities for SimpleChores integration."""
 from __future__ import annotations
 
-from datetime import datetime
+import logging
+import re
+from secrets import token_hex
+import time
+import traceback
 import uuid
 
 from homeassistant.components.todo import TodoItem, TodoItemStatus, TodoListEntity, TodoListEntityFeature
@@ -9,16 +13,21 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import SimpleChoresCoordinator
+from .const import CONF_KIDS, DEFAULT_KIDS, DOMAIN
+from .coordinator import SimpleChoresCoordinator, parse_kids
+from .models import PendingApproval
+
+_LOGGER = logging.getLogger(__name__)
+
+# "(+N)" point notation in manual chore summaries
+_POINTS_RE = re.compile(r"\(\+(\d+)\)")
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entities: AddEntitiesCallback):
     if not entry.data.get("use_todo", True):
         return
     coordinator: SimpleChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
-    kids_csv = entry.data.get("kids", "alex,emma")
-    kids = [k.strip() for k in kids_csv.split(",") if k.strip()]
+    kids = parse_kids(entry.data.get(CONF_KIDS, DEFAULT_KIDS))
     add_entities([KidTodoList(coordinator, kid) for kid in kids], True)
 
 class KidTodoList(TodoListEntity):
@@ -26,6 +35,8 @@ class KidTodoList(TodoListEntity):
         self._coord = coord
         self._kid_id = kid_id
         self._items: list[TodoItem] = []
+        # uid -> position in self._items; checked on use and rebuilt when stale
+        self._item_index: dict[str, int] = {}
         self._attr_name = f"{kid_id.capitalize()} Chores"
         self._attr_unique_id = f"simplechores_todo_{kid_id}"
         self.entity_id = f"todo.{kid_id}_chores"
@@ -37,9 +48,7 @@ class KidTodoList(TodoListEntity):
         )
 
         # Store reference in coordinator for direct access
-        if not hasattr(coord, '_todo_entities'):
-            coord._todo_entities = {}
-        coord._todo_entities[kid_id] = self
+        coord.register_todo_entity(kid_id, self)
 
     async def async_added_to_hass(self):
         """Called when entity is added to Home Assistant."""
@@ -48,32 +57,36 @@ class KidTodoList(TodoListEntity):
         await self._restore_todo_items()
 
     async def _restore_todo_items(self):
-        """Restore todo items from coordinator storage"""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        
+        """Restore todo items from coordinator storage.
+
+        Does not write state: the platform writes it right after
+        async_added_to_hass returns, so a write here would be a duplicate.
+        """
         stored_items = self._coord.get_todo_items_for_kid(self._kid_id)
-        _LOGGER.info(f"SimpleChores: Restoring {len(stored_items)} todo items for {self._kid_id}")
-        
-        self._items = []
-        for stored_item in stored_items:
-            # Convert stored status back to enum
-            status = TodoItemStatus.COMPLETED if stored_item.status == "completed" else TodoItemStatus.NEEDS_ACTION
-            
-            todo_item = TodoItem(
+        self._items = [
+            TodoItem(
                 summary=stored_item.summary,
                 uid=stored_item.uid,
-                status=status
+                # Convert stored status back to enum
+                status=TodoItemStatus.COMPLETED if stored_item.status == "completed" else TodoItemStatus.NEEDS_ACTION,
             )
-            self._items.append(todo_item)
-            
-        _LOGGER.info(f"SimpleChores: Restored {len(self._items)} todo items for {self._kid_id}")
+            for stored_item in stored_items
+        ]
+        self._item_index = {item.uid: n for n, item in enumerate(self._items)}
+        _LOGGER.info("SimpleChores: Restored %d todo items for %s", len(self._items), self._kid_id)
+
+    def _find_item(self, uid: str) -> int | None:
+        """Return the position of the item with uid in self._items, or None."""
+        items = self._items
+        i = self._item_index.get(uid)
+        if i is None or i >= len(items) or items[i].uid != uid:
+            self._item_index = {item.uid: n for n, item in enumerate(items)}
+            i = self._item_index.get(uid)
+        return i
 
     async def async_get_items(self):
         """Get todo items - called by Home Assistant."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: async_get_items called, returning {len(self._items)} items")
+        _LOGGER.debug("SimpleChores: async_get_items called, returning %s items", len(self._items))
         return self._items
 
     async def async_get_todo_items(self):
@@ -86,131 +99,120 @@ class KidTodoList(TodoListEntity):
         return self._items
 
     async def async_create_item(self, item: TodoItem):
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: Creating todo item: {item}")
-        _LOGGER.debug(f"SimpleChores: Item UID: {getattr(item, 'uid', 'NO_UID')}")
-        _LOGGER.debug(f"SimpleChores: Item summary: {getattr(item, 'summary', 'NO_SUMMARY')}")
-        _LOGGER.debug(f"SimpleChores: Item status: {getattr(item, 'status', 'NO_STATUS')}")
+        uid = getattr(item, 'uid', None)
+        status = getattr(item, 'status', None)
+        _LOGGER.debug("SimpleChores: Creating todo item: %s", item)
+        _LOGGER.debug("SimpleChores: Item UID: %s", uid)
+        _LOGGER.debug("SimpleChores: Item summary: %s", getattr(item, 'summary', 'NO_SUMMARY'))
+        _LOGGER.debug("SimpleChores: Item status: %s", status)
 
         # Ensure the item has all required properties - create a new item if needed
-        if not hasattr(item, 'status') or item.status is None or not hasattr(item, 'uid') or item.uid is None:
+        if uid is None or status is None:
             _LOGGER.warning("SimpleChores: Item missing required properties, creating new item")
-            import uuid
-
-            # Create a properly formed TodoItem
-            fixed_item = TodoItem(
+            item = TodoItem(
                 summary=getattr(item, 'summary', 'Unknown chore'),
-                uid=getattr(item, 'uid', None) or str(uuid.uuid4()),
-                status=getattr(item, 'status', None) or TodoItemStatus.NEEDS_ACTION
+                uid=uid or str(uuid.uuid4()),
+                status=status or TodoItemStatus.NEEDS_ACTION
             )
-            self._items.append(fixed_item)
-            item = fixed_item
-        else:
-            self._items.append(item)
-            
+        self._item_index[item.uid] = len(self._items)
+        self._items.append(item)
+
         # Save to persistent storage
         status_str = "completed" if item.status == TodoItemStatus.COMPLETED else "needs_action"
         await self._coord.save_todo_item(item.uid, item.summary, status_str, self._kid_id)
         
-        # Force state update
+        # Items live on the entity, so a direct write is all HA needs
         self.async_write_ha_state()
-        # Also schedule an update
-        self.async_schedule_update_ha_state(force_refresh=True)
-        _LOGGER.info(f"SimpleChores: Todo item created successfully. Total items: {len(self._items)}")
+        _LOGGER.info("SimpleChores: Todo item created successfully. Total items: %s", len(self._items))
 
     async def async_create_todo_item(self, item: TodoItem) -> None:
         """Create a new todo item - this is the method Home Assistant calls."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: async_create_todo_item called with: {item}")
+        _LOGGER.debug("SimpleChores: async_create_todo_item called with: %s", item)
         await self.async_create_item(item)
 
     async def async_update_item(self, item: TodoItem):
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: Updating todo item: {item}")
+        _LOGGER.debug("SimpleChores: Updating todo item: %s", item)
 
         handled_approval_logic = False
-        for i, old in enumerate(self._items):
-            if old.uid == item.uid:
-                _LOGGER.debug(
-                    f"SimpleChores: Found item to update - old status: {old.status}, new status: {item.status}"
-                )
-                # Handle chore completion with approval workflow - NEW CLEAN APPROACH
-                if item.status == TodoItemStatus.COMPLETED and old.status != TodoItemStatus.COMPLETED:
-                    _LOGGER.info(f"SimpleChores: Item completed: {item.summary}")
-
-                    # Check if this is a tracked chore that needs approval
-                    if item.uid in self._coord.model.pending_chores:
-                        _LOGGER.info(f"SimpleChores: Moving tracked chore to approval queue: {item.uid}")
-                        approval_id = await self._coord.request_approval(item.uid)
-                        if approval_id:
-                            _LOGGER.info(f"SimpleChores: Chore moved to approval queue: {approval_id}")
-                            # Let the chore stay completed in the todo list - no status hijacking
-                            handled_approval_logic = True
-                    else:
-                        # Check for manual chores with point notation
-                        pts = 0
-                        if item.summary and "(+" in item.summary and ")" in item.summary:
-                            try:
-                                pts = int(item.summary.split("(+")[1].split(")")[0])
-                            except Exception:
-                                pts = 0
-
-                        if pts:
-                            _LOGGER.info(f"SimpleChores: Moving manual chore to approval queue: {item.summary}")
-                            # Create a pending approval for manual chores
-                            approval_id = str(uuid.uuid4())[:8]
-                            from .models import PendingApproval
-                            approval = PendingApproval(
-                                id=approval_id,
-                                todo_uid=item.uid,
-                                kid_id=self._kid_id,
-                                title=item.summary,
-                                points=pts,
-                                completed_ts=datetime.now().timestamp()
-                            )
-                            self._coord.model.pending_approvals[approval_id] = approval
-                            await self._coord.async_save()
-
-                            # Update approval buttons
-                            await self._coord._update_approval_buttons()
-
-                            _LOGGER.info(f"SimpleChores: Manual chore moved to approval queue: {approval_id}")
-                            handled_approval_logic = True
-                        else:
-                            # No points, just a regular completion
-                            _LOGGER.info(f"SimpleChores: Regular chore completed (no approval needed): {item.summary}")
-
-                # Handle unchecking completed items - reset approval if needed
-                elif item.status == TodoItemStatus.NEEDS_ACTION and old.status == TodoItemStatus.COMPLETED:
-                    _LOGGER.info(f"SimpleChores: Item unchecked: {item.summary}")
-                    
-                    # Remove any pending approvals for this todo item
-                    approvals_to_remove = []
-                    for approval_id, approval in self._coord.model.pending_approvals.items():
-                        if approval.todo_uid == item.uid and approval.status == "pending_approval":
-                            approvals_to_remove.append(approval_id)
-
-                    if approvals_to_remove:
-                        for approval_id in approvals_to_remove:
-                            del self._coord.model.pending_approvals[approval_id]
-                            _LOGGER.info(f"SimpleChores: Removed pending approval due to unchecking: {approval_id}")
-
-                        # Reset chore status if it exists
-                        if item.uid in self._coord.model.pending_chores:
-                            self._coord.model.pending_chores[item.uid].status = "pending"
-                            self._coord.model.pending_chores[item.uid].completed_ts = None
-
-                        await self._coord.async_save()
+        # Visible fields before the update; unknown items always write state
+        previous = None
+        i = self._find_item(item.uid)
+        if i is not None:
+            old = self._items[i]
+            previous = (old.summary, old.status)
+            _LOGGER.debug(
+                "SimpleChores: Found item to update - old status: %s, new status: %s", old.status, item.status
+            )
+            # Handle chore completion with approval workflow - NEW CLEAN APPROACH
+            if item.status == TodoItemStatus.COMPLETED and old.status != TodoItemStatus.COMPLETED:
+                _LOGGER.info("SimpleChores: Item completed: %s", item.summary)
+
+                # Check if this is a tracked chore that needs approval
+                if item.uid in self._coord.model.pending_chores:
+                    _LOGGER.info("SimpleChores: Moving tracked chore to approval queue: %s", item.uid)
+                    approval_id = await self._coord.request_approval(item.uid)
+                    if approval_id:
+                        _LOGGER.info("SimpleChores: Chore moved to approval queue: %s", approval_id)
+                        # Let the chore stay completed in the todo list - no status hijacking
+                        handled_approval_logic = True
+                else:
+                    # Check for manual chores with point notation
+                    match = _POINTS_RE.search(item.summary or "")
+                    pts = int(match.group(1)) if match else 0
+
+                    if pts:
+                        _LOGGER.info("SimpleChores: Moving manual chore to approval queue: %s", item.summary)
+                        # Create a pending approval for manual chores
+                        approval_id = token_hex(4)
+                        approval = PendingApproval(
+                            id=approval_id,
+                            todo_uid=item.uid,
+                            kid_id=self._kid_id,
+                            title=item.summary,
+                            points=pts,
+                            completed_ts=time.time()
+                        )
+                        self._coord.add_approval(approval)
+                        self._coord.async_schedule_save()
+
+                        # Update approval buttons
                         await self._coord._update_approval_buttons()
-                        _LOGGER.info(f"SimpleChores: Reset approval state for unchecked item: {item.summary}")
+
+                        _LOGGER.info("SimpleChores: Manual chore moved to approval queue: %s", approval_id)
                         handled_approval_logic = True
+                    else:
+                        # No points, just a regular completion
+                        _LOGGER.info("SimpleChores: Regular chore completed (no approval needed): %s", item.summary)
 
-                # Update the item in the list after all modifications
-                self._items[i] = item
-                break
+            # Handle unchecking completed items - reset approval if needed
+            elif item.status == TodoItemStatus.NEEDS_ACTION and old.status == TodoItemStatus.COMPLETED:
+                _LOGGER.info("SimpleChores: Item unchecked: %s", item.summary)
+                
+                # Remove any pending approvals for this todo item
+                pending_approvals = self._coord.model.pending_approvals
+                approvals_to_remove = [
+                    approval_id
+                    for approval_id in self._coord.model.approval_ids_for_todo(item.uid)
+                    if pending_approvals[approval_id].status == "pending_approval"
+                ]
+
+                if approvals_to_remove:
+                    for approval_id in approvals_to_remove:
+                        self._coord.remove_approval(approval_id)
+                        _LOGGER.info("SimpleChores: Removed pending approval due to unchecking: %s", approval_id)
+
+                    # Reset chore status if it exists
+                    if item.uid in self._coord.model.pending_chores:
+                        self._coord.model.pending_chores[item.uid].status = "pending"
+                        self._coord.model.pending_chores[item.uid].completed_ts = None
+
+                    self._coord.async_schedule_save()
+                    await self._coord._update_approval_buttons()
+                    _LOGGER.info("SimpleChores: Reset approval state for unchecked item: %s", item.summary)
+                    handled_approval_logic = True
+
+            # Update the item in the list after all modifications
+            self._items[i] = item
                 
         # Clean approach: No more tag manipulation needed
         
@@ -219,93 +221,94 @@ class KidTodoList(TodoListEntity):
         # Save todo item changes, skip coordinator save if approval logic already handled it
         skip_save = handled_approval_logic
         await self._coord.save_todo_item(item.uid, item.summary, status_str, self._kid_id, skip_save=skip_save)
-        
-        self.async_write_ha_state()
+
+        # HA re-sends unchanged items during sync; only announce real changes
+        if previous != (item.summary, item.status):
+            self.async_write_ha_state()
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         """Update a todo item - this is the method Home Assistant calls."""
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.info(f"SimpleChores: ===== HOME ASSISTANT TODO UPDATE CALLED =====")
-        _LOGGER.info(f"SimpleChores: HA UPDATE - Item: {item}")
-        _LOGGER.info(f"SimpleChores: HA UPDATE - Type: {type(item)}")
-
         if item is None:
             _LOGGER.error("SimpleChores: Received None item in async_update_todo_item")
             return
 
         try:
-            # Log all item properties for debugging  
-            _LOGGER.info(f"SimpleChores: HA UPDATE - UID: {getattr(item, 'uid', 'NO_UID')}")
-            _LOGGER.info(f"SimpleChores: HA UPDATE - Summary: '{getattr(item, 'summary', 'NO_SUMMARY')}'")
-            _LOGGER.info(f"SimpleChores: HA UPDATE - Status: {getattr(item, 'status', 'NO_STATUS')}")
-            
-            # Find the current item in our list to see what changed
-            current_item = None
-            for list_item in self._items:
-                if list_item.uid == item.uid:
-                    current_item = list_item
-                    break
-            
-            if current_item:
-                _LOGGER.info(f"SimpleChores: HA UPDATE - Current item summary: '{current_item.summary}'")
-                _LOGGER.info(f"SimpleChores: HA UPDATE - Current item status: {current_item.status}")
-                _LOGGER.info(f"SimpleChores: HA UPDATE - Status changed: {current_item.status} -> {item.status}")
-                _LOGGER.info(f"SimpleChores: HA UPDATE - Summary changed: '{current_item.summary}' -> '{item.summary}'")
-            else:
-                _LOGGER.info(f"SimpleChores: HA UPDATE - Item not found in current list (new item?)")
-                
-            _LOGGER.info(f"SimpleChores: HA UPDATE - About to call async_update_item...")
+            # Per-call diagnostics, including the lookup of the stored item,
+            # only run when someone is actually reading debug output
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("SimpleChores: HA UPDATE - Type: %s", type(item))
+                _LOGGER.debug("SimpleChores: HA UPDATE - UID: %s", getattr(item, 'uid', 'NO_UID'))
+                _LOGGER.debug("SimpleChores: HA UPDATE - Summary: '%s'", getattr(item, 'summary', 'NO_SUMMARY'))
+                _LOGGER.debug("SimpleChores: HA UPDATE - Status: %s", getattr(item, 'status', 'NO_STATUS'))
+
+                # Find the current item in our list to see what changed
+                i = self._find_item(getattr(item, 'uid', None))
+                current_item = self._items[i] if i is not None else None
+
+                if current_item:
+                    _LOGGER.debug(
+                        "SimpleChores: HA UPDATE - Status changed: %s -> %s", current_item.status, item.status
+                    )
+                    _LOGGER.debug(
+                        "SimpleChores: HA UPDATE - Summary changed: '%s' -> '%s'", current_item.summary, item.summary
+                    )
+                else:
+                    _LOGGER.debug("SimpleChores: HA UPDATE - Item not found in current list (new item?)")
 
             if not hasattr(item, 'uid') or item.uid is None:
-                _LOGGER.error(f"SimpleChores: Item missing UID: {item}")
+                _LOGGER.error("SimpleChores: Item missing UID: %s", item)
                 return
 
             await self.async_update_item(item)
-            _LOGGER.info(f"SimpleChores: HA UPDATE - async_update_item completed successfully")
+            _LOGGER.debug("SimpleChores: HA UPDATE - async_update_item completed successfully")
         except Exception as e:
-            _LOGGER.error(f"SimpleChores: Error in async_update_todo_item: {e}")
-            import traceback
-            _LOGGER.error(f"SimpleChores: Traceback: {traceback.format_exc()}")
-
-    async def async_delete_item(self, uid: str):
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"SimpleChores: Deleting todo item: {uid}")
+            _LOGGER.error("SimpleChores: Error in async_update_todo_item: %s", e)
+            _LOGGER.error("SimpleChores: Traceback: %s", traceback.format_exc())
 
-        # Remove the item from the todo list
-        self._items = [i for i in self._items if i.uid != uid]
+    def _drop_item_data(self, uid: str) -> bool:
+        """Remove an item's pending chore and approvals; return True if approvals were removed."""
+        _LOGGER.debug("SimpleChores: Deleting todo item: %s", uid)
 
         # Clean up associated pending chore data
-        removed_pending_chore = False
-        if uid in self._coord.model.pending_chores:
-            _LOGGER.info(f"SimpleChores: Removing pending chore for deleted item: {uid}")
-            del self._coord.model.pending_chores[uid]
-            removed_pending_chore = True
+        if self._coord.remove_pending_chore(uid) is not None:
+            _LOGGER.info("SimpleChores: Removing pending chore for deleted item: %s", uid)
 
         # Clean up any associated pending approvals
-        approvals_to_remove = []
-        for approval_id, approval in self._coord.model.pending_approvals.items():
-            if approval.todo_uid == uid:
-                approvals_to_remove.append(approval_id)
+        approvals_to_remove = self._coord.model.approval_ids_for_todo(uid)
 
         for approval_id in approvals_to_remove:
-            _LOGGER.info(f"SimpleChores: Removing pending approval for deleted item: {approval_id}")
-            del self._coord.model.pending_approvals[approval_id]
+            _LOGGER.info("SimpleChores: Removing pending approval for deleted item: %s", approval_id)
+            self._coord.remove_approval(approval_id)
 
-        # Save the updated coordinator state if we removed any data
-        if removed_pending_chore or approvals_to_remove:
-            await self._coord.async_save()
-            # Update approval buttons if any approvals were removed
-            if approvals_to_remove:
-                await self._coord._update_approval_buttons()
+        return bool(approvals_to_remove)
 
-        # Remove from persistent todo storage
+    async def async_delete_item(self, uid: str):
+        # Remove the item from the todo list in place; later positions in the
+        # uid index go stale and _find_item rebuilds it on the next miss
+        i = self._find_item(uid)
+        if i is not None:
+            del self._items[i]
+
+        # Update approval buttons if any approvals were removed
+        if self._drop_item_data(uid):
+            await self._coord._update_approval_buttons()
+
+        # Remove from persistent todo storage; the save it schedules also
+        # covers the pending chore and approval cleanup above
         await self._coord.remove_todo_item(uid)
 
         self.async_write_ha_state()
 
     async def async_delete_todo_items(self, uids: list[str]) -> None:
         """Delete todo items - this is the method Home Assistant calls."""
-        for uid in uids:
-            await self.async_delete_item(uid)
+        # One list pass, one button refresh, one save and one state write
+        # for the whole batch
+        uid_set = set(uids)
+        self._items = [i for i in self._items if i.uid not in uid_set]
+        approvals_removed = False
+        for uid in uid_set:
+            approvals_removed |= self._drop_item_data(uid)
+        if approvals_removed:
+            await self._coord._update_approval_buttons()
+        await self._coord.remove_todo_items(uid_set)
+        self.async_write_ha_state()
@@ -36,6 +36,7 @@ async def mock_hass():
     hass.data = {}
     hass.config_entries = Mock()
     hass.services = Mock()
+    hass.bus = Mock()
     hass.states = Mock()
     hass.loop = Mock()
 
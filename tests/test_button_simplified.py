@@ -206,7 +206,7 @@ class TestSimpleChoresApprovalStatusButton:
             mock_logger.info.assert_called()
             # Check that info was called with expected format
             calls = mock_logger.info.call_args_list
-            assert any("2 pending approvals:" in str(call) for call in calls)
+            assert any("2 pending approvals:" in call.args[0] % call.args[1:] for call in calls)
     
     @pytest.mark.asyncio
     async def test_button_press_no_approvals(self, button, coordinator):
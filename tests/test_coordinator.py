@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+import gc
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from custom_components.simplechores.coordinator import SimpleChoresCoordinator
+from custom_components.simplechores.coordinator import SimpleChoresCoordinator, parse_kids
 from custom_components.simplechores.models import (
     Kid,
+    LedgerEntry,
     PendingApproval,
     PendingChore,
     RecurringChore,
@@ -88,6 +90,49 @@ class TestSimpleChoresCoordinator:
             # Should not add default rewards when some exist
             assert len(coordinator.model.rewards) == 1
 
+    @pytest.mark.asyncio
+    async def test_async_init_merges_mixed_case_kids(self, mock_hass, mock_store):
+        """Test that kids stored in two casings are merged rather than dropped."""
+        existing_model = StorageModel(
+            kids={"Alex": Kid(id="Alex", name="Alex", points=7), "alex": Kid(id="alex", name="Alex", points=5),
+                  "Emma": Kid(id="Emma", name="Emma", points=3)},
+            ledger=[LedgerEntry(ts=1.0, kid_id="Alex", delta=7, reason="Chore", kind="earn")],
+            rewards={"test": Reward(id="test", title="Test", cost=10)},
+        )
+
+        with patch('custom_components.simplechores.coordinator.SimpleChoresStore') as mock_store_class:
+            mock_store_class.return_value = mock_store
+            mock_store.async_load.return_value = existing_model
+
+            coordinator = SimpleChoresCoordinator(mock_hass)
+            with patch('custom_components.simplechores.coordinator._LOGGER') as mock_logger:
+                await coordinator.async_init()
+
+            assert set(coordinator.model.kids) == {"alex", "emma"}
+            assert coordinator.get_points("alex") == 12
+            assert coordinator.model.kids["emma"].id == "emma"
+            assert coordinator.model.ledger[0].kid_id == "alex"
+            assert coordinator.model.points_earned("Alex") == 7
+            mock_logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_kid_keys_normalized_on_insert(self, coordinator):
+        """Test that per-kid data is stored under the lowercase kid id."""
+        coordinator._update_entities = AsyncMock()
+        coordinator._update_approval_buttons = AsyncMock()
+
+        await coordinator.add_points("Alice", 5, "Chore")
+        todo_uid = await coordinator.create_pending_chore("Alice", "Dishes", 3)
+        await coordinator.create_recurring_chore("Alice", "Teeth", 1, "daily")
+        await coordinator.save_todo_item("uid1", "Bed", "needs_action", "Alice")
+
+        assert coordinator.model.ledger[-1].kid_id == "alice"
+        assert list(coordinator.model.pending_by_kid) == ["alice"]
+        assert list(coordinator.model.recurring_by_kid) == ["alice"]
+        assert list(coordinator.model.todo_items_by_kid) == ["alice"]
+        assert [c.todo_uid for c in coordinator.get_pending_chores("ALICE")] == [todo_uid]
+        assert len(coordinator.get_todo_items_for_kid("alice")) == 1
+
     @pytest.mark.asyncio
     async def test_ensure_kid_new(self, coordinator):
         """Test ensuring a new kid."""
@@ -167,6 +212,21 @@ class TestSimpleChoresCoordinator:
         assert coordinator.model.kids["bob"].points == 15
         assert coordinator.model.kids["bob"].name == "bob"
 
+    @pytest.mark.asyncio
+    async def test_kid_listeners(self, coordinator):
+        """Test that kid listeners run on that kid's ledger appends only."""
+        coordinator._update_entities = AsyncMock()
+        listener = Mock()
+        unsubscribe = coordinator.async_add_kid_listener("Alice", listener)
+
+        await coordinator.add_points("alice", 5, "Chore")
+        await coordinator.add_points("bob", 5, "Chore")
+        listener.assert_called_once_with()
+
+        unsubscribe()
+        await coordinator.add_points("alice", 5, "Chore")
+        listener.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_remove_points(self, coordinator):
         """Test removing points."""
@@ -302,6 +362,7 @@ class TestSimpleChoresCoordinator:
         assert len(chores) == 2
         assert chore1 in chores
         assert chore2 in chores
+        assert len(coordinator.get_recurring_chores("")) == 2
 
     def test_get_recurring_chores_filtered(self, coordinator):
         """Test getting recurring chores filtered by kid."""
@@ -446,10 +507,259 @@ class TestSimpleChoresCoordinator:
             id="2", todo_uid="uid2", kid_id="bob", title="Task2",
             points=15, completed_ts=123457.0, status="approved"
         )
-        coordinator.model.pending_approvals = {"1": approval1, "2": approval2}
+        coordinator.model = StorageModel(pending_approvals={"1": approval1, "2": approval2})
 
         pending = coordinator.get_pending_approvals()
         assert len(pending) == 1
         assert approval1 in pending
         assert approval2 not in pending
 
+
+    @pytest.mark.asyncio
+    async def test_mutations_schedule_debounced_save(self, coordinator, mock_store):
+        """Test that mutations coalesce into a scheduled save instead of writing immediately."""
+        coordinator._save_debouncer = Mock()
+        coordinator._update_entities = AsyncMock()
+
+        await coordinator.add_points("alice", 5, "First", "earn")
+        await coordinator.add_points("alice", 5, "Second", "earn")
+
+        mock_store.async_save.assert_not_called()
+        assert coordinator._save_debouncer.async_schedule_call.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_shutdown_flushes_pending_save(self, coordinator, mock_store):
+        """Test that shutdown cancels the debouncer and writes the model once."""
+        coordinator._save_debouncer = Mock()
+
+        await coordinator.async_shutdown()
+
+        coordinator._save_debouncer.async_shutdown.assert_called_once()
+        mock_store.async_save.assert_called_once_with(coordinator.model)
+
+    @pytest.mark.asyncio
+    async def test_save_todo_item_indexes_by_uid_and_kid(self, coordinator):
+        """Test that todo items are stored by uid and indexed per kid."""
+        await coordinator.save_todo_item("uid1", "Dishes (+5)", "needs_action", "alice")
+        await coordinator.save_todo_item("uid2", "Trash (+3)", "needs_action", "bob")
+        original = coordinator.get_todo_item("uid1")
+        await coordinator.save_todo_item("uid1", "Dishes (+5)", "completed", "alice")
+
+        assert coordinator.get_todo_item("uid1") is original
+        assert coordinator.get_todo_item("uid1").status == "completed"
+        assert [item.uid for item in coordinator.get_todo_items_for_kid("alice")] == ["uid1"]
+        assert [item.uid for item in coordinator.get_todo_items_for_kid("bob")] == ["uid2"]
+
+        await coordinator.remove_todo_item("uid1")
+
+        assert coordinator.get_todo_item("uid1") is None
+        assert coordinator.get_todo_items_for_kid("alice") == []
+
+        coordinator.async_schedule_save = Mock()
+        await coordinator.remove_todo_items(["uid2", "missing"])
+
+        assert coordinator.get_todo_item("uid2") is None
+        assert coordinator.get_todo_items_for_kid("bob") == []
+        coordinator.async_schedule_save.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_kid_ids_are_normalized_to_lowercase(self, coordinator):
+        """Test that mixed-case kid ids share one kid and one number entity."""
+        entity = Mock()
+        coordinator._entities = {"alice": entity}
+
+        await coordinator.add_points("Alice", 5, "Chore", "earn")
+        await coordinator.add_points("alice", 3, "Chore", "earn")
+
+        assert list(coordinator.model.kids) == ["alice"]
+        assert coordinator.get_points("ALICE") == 8
+        assert entity.async_write_ha_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_entities_skips_unchanged_points(self, coordinator):
+        """Test that the number entity is only written when the balance changes."""
+        entity = Mock()
+        coordinator._entities = {"alice": entity}
+
+        await coordinator.add_points("alice", 5, "Chore", "earn")
+        await coordinator.add_points("alice", 0, "No-op", "adjust")
+
+        entity.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_entities_service_fallback_only_without_entity(self, coordinator, mock_hass):
+        """Test that the update_entity service is only used when no entity is registered."""
+        coordinator._entities = {"alice": Mock()}
+
+        await coordinator.add_points("alice", 5, "Chore", "earn")
+        mock_hass.services.async_call.assert_not_called()
+
+        await coordinator.add_points("bob", 5, "Chore", "earn")
+        mock_hass.services.async_call.assert_awaited_once_with(
+            "homeassistant", "update_entity", {"entity_id": "number.bob_points"}, blocking=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_recurring_and_pending_chores_indexed_by_kid(self, coordinator):
+        """Test that per-kid reads are served from the kid indexes."""
+        coordinator._update_approval_buttons = AsyncMock()
+        alice_chore = await coordinator.create_recurring_chore("alice", "Bed", 2, "daily")
+        await coordinator.create_recurring_chore("bob", "Trash", 3, "weekly", 1)
+        alice_uid = await coordinator.create_pending_chore("alice", "Dishes", 5)
+        await coordinator.create_pending_chore("bob", "Laundry", 4)
+
+        assert [c.id for c in coordinator.get_recurring_chores("alice")] == [alice_chore]
+        assert len(coordinator.get_recurring_chores()) == 2
+        assert [c.todo_uid for c in coordinator.get_pending_chores("alice")] == [alice_uid]
+
+        removed = coordinator.remove_pending_chore(alice_uid)
+
+        assert removed.todo_uid == alice_uid
+        assert coordinator.get_pending_chores("alice") == []
+        assert coordinator.remove_pending_chore(alice_uid) is None
+
+    @pytest.mark.asyncio
+    async def test_request_approval_shares_one_timestamp(self, coordinator):
+        """Test that the approval and the chore record the same completion time."""
+        coordinator._update_approval_buttons = AsyncMock()
+        coordinator._create_dynamic_approval_buttons = AsyncMock()
+        todo_uid = await coordinator.create_pending_chore("alice", "Dishes", 5, now=1000.0)
+
+        approval_id = await coordinator.request_approval(todo_uid)
+
+        chore = coordinator.model.pending_chores[todo_uid]
+        assert chore.created_ts == 1000.0
+        assert coordinator.model.pending_approvals[approval_id].completed_ts == chore.completed_ts
+
+    @pytest.mark.asyncio
+    async def test_generate_daily_chores_batches_todo_creation(self, coordinator):
+        """Test that generation schedules one save and fills each kid's todo list."""
+        coordinator._save_debouncer = Mock()
+        coordinator._update_approval_buttons = AsyncMock()
+        alice_list = Mock()
+        alice_list.async_create_item = AsyncMock()
+        coordinator._todo_entities = {"alice": alice_list}
+        coordinator.model.recurring_chores = {
+            "1": RecurringChore(id="1", title="Bed", points=2, kid_id="alice", schedule_type="daily"),
+            "2": RecurringChore(id="2", title="Teeth", points=1, kid_id="alice", schedule_type="daily"),
+            "3": RecurringChore(id="3", title="Feed cat", points=3, kid_id="bob", schedule_type="daily"),
+        }
+
+        await coordinator.generate_daily_chores()
+
+        assert len(coordinator.model.pending_chores) == 3
+        assert alice_list.async_create_item.await_count == 2
+        coordinator._save_debouncer.async_schedule_call.assert_called_once()
+        coordinator._update_approval_buttons.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_weekly_chores_one_save_per_run(self, coordinator, mock_store):
+        """Test that each generation run schedules exactly one debounced save."""
+        coordinator._save_debouncer = Mock()
+        coordinator._update_approval_buttons = AsyncMock()
+        lists = {kid: Mock(async_create_item=AsyncMock()) for kid in ("alice", "bob")}
+        coordinator._todo_entities = lists
+        coordinator.model.recurring_chores = {
+            str(n): RecurringChore(
+                id=str(n), title=f"Chore {n}", points=n, kid_id=("alice", "bob")[n % 2],
+                schedule_type="weekly", day_of_week=5,
+            )
+            for n in range(6)
+        }
+
+        await coordinator.generate_weekly_chores(5)
+        assert coordinator._save_debouncer.async_schedule_call.call_count == 1
+
+        await coordinator.generate_weekly_chores(5)
+        assert coordinator._save_debouncer.async_schedule_call.call_count == 2
+
+        # A run with nothing to generate does not save at all
+        await coordinator.generate_weekly_chores(2)
+        assert coordinator._save_debouncer.async_schedule_call.call_count == 2
+
+        assert len(coordinator.model.pending_chores) == 12
+        assert all(todo_list.async_create_item.await_count == 6 for todo_list in lists.values())
+        mock_store.async_save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_active_approvals_follow_status_changes(self, coordinator):
+        """Test that decided or removed approvals drop out of the pending list."""
+        coordinator._update_approval_buttons = AsyncMock()
+        coordinator._create_dynamic_approval_buttons = AsyncMock()
+        coordinator._update_entities = AsyncMock()
+        approval_ids = []
+        for title in ("Dishes", "Trash", "Laundry"):
+            todo_uid = await coordinator.create_pending_chore("alice", title, 5)
+            approval_ids.append(await coordinator.request_approval(todo_uid))
+
+        assert [a.id for a in coordinator.get_pending_approvals()] == approval_ids
+        assert coordinator.get_pending_approvals() is coordinator.get_pending_approvals()
+        version = coordinator.approvals_version
+
+        await coordinator.approve_chore(approval_ids[0])
+        await coordinator.reject_chore(approval_ids[1])
+        coordinator.remove_approval(approval_ids[2])
+
+        assert coordinator.approvals_version == version + 3
+        assert coordinator.get_pending_approvals() == []
+        assert approval_ids[1] in coordinator.model.pending_approvals
+
+    def test_approval_index_kept_current_without_rebuild(self, coordinator):
+        """Test that adding and removing approvals updates the todo_uid index in place."""
+        def approval(approval_id, todo_uid):
+            return PendingApproval(
+                id=approval_id, todo_uid=todo_uid, kid_id="alice", title="Chore", points=5, completed_ts=0.0
+            )
+
+        coordinator.add_approval(approval("a1", "uid1"))
+        assert coordinator.model.approval_ids_for_todo("uid1") == ["a1"]
+        by_todo = coordinator.model._approvals_by_todo[2]
+
+        coordinator.add_approval(approval("a2", "uid1"))
+        coordinator.add_approval(approval("a3", "uid2"))
+        for approval_id in coordinator.model.approval_ids_for_todo("uid1"):
+            coordinator.remove_approval(approval_id)
+
+        assert coordinator.model._approvals_by_todo[2] is by_todo
+        assert coordinator.model.approval_ids_for_todo("uid1") == []
+        assert coordinator.model.approval_ids_for_todo("uid2") == ["a3"]
+
+    @pytest.mark.asyncio
+    async def test_chore_completion_and_approval_do_not_write_directly(self, coordinator, mock_store):
+        """Test that completing or approving a chore leaves persistence to the debouncer."""
+        coordinator._save_debouncer = Mock()
+        coordinator._update_approval_buttons = AsyncMock()
+        coordinator._create_dynamic_approval_buttons = AsyncMock()
+        coordinator._update_entities = AsyncMock()
+
+        todo_uid = await coordinator.create_pending_chore("alice", "Dishes", 5)
+        assert await coordinator.complete_chore_by_uid(todo_uid) is True
+
+        todo_uid = await coordinator.create_pending_chore("alice", "Trash", 3)
+        approval_id = await coordinator.request_approval(todo_uid)
+        assert await coordinator.approve_chore(approval_id) is True
+
+        mock_store.async_save.assert_not_called()
+        assert coordinator.get_points("alice") == 8
+
+    def test_entity_registry_drops_released_entities(self, coordinator):
+        """Test that entities no longer referenced elsewhere leave the registry."""
+        class _Entity:
+            pass
+
+        entity = _Entity()
+        coordinator.register_entity("Alice", entity)
+        assert coordinator._entities.get("alice") is entity
+
+        del entity
+        gc.collect()
+
+        assert coordinator._entities.get("alice") is None
+
+
+def test_parse_kids_strips_blanks_and_caches():
+    """Test that the kids CSV is parsed once per distinct value."""
+    assert parse_kids(" alice, bob ,,") == ("alice", "bob")
+    assert parse_kids(" alice, bob ,,") is parse_kids(" alice, bob ,,")
+    assert parse_kids(" , ") == ()
+    assert parse_kids("alice,bob,alice") == ("alice", "bob")
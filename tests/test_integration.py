@@ -4,6 +4,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant, ServiceCall
 import pytest
 import pytest_asyncio
@@ -31,6 +32,7 @@ class TestSimpleChoresIntegration:
         hass.data = {}
         hass.config_entries = Mock()
         hass.services = Mock()
+        hass.bus = Mock()
         hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
         hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
         hass.services.async_register = Mock()
@@ -92,12 +94,36 @@ class TestSimpleChoresIntegration:
     async def test_async_unload_entry(self, mock_hass, mock_config_entry):
         """Test unloading the integration."""
         # Set up hass data
-        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: Mock()}}
+        coordinator = Mock()
+        coordinator.async_shutdown = AsyncMock()
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: coordinator}}
 
         result = await async_unload_entry(mock_hass, mock_config_entry)
 
         assert result is True
         mock_hass.config_entries.async_unload_platforms.assert_called_once()
+        # Pending storage writes should be flushed on unload
+        coordinator.async_shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_final_write_flushes_pending_save(self, mock_hass, mock_config_entry):
+        """Test Home Assistant shutdown flushes the debounced save."""
+        with patch('custom_components.simplechores.SimpleChoresCoordinator') as mock_coordinator_class:
+            mock_coordinator = Mock()
+            mock_coordinator.async_init = AsyncMock()
+            mock_coordinator.async_shutdown = AsyncMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            await async_setup_entry(mock_hass, mock_config_entry)
+
+        mock_hass.bus.async_listen_once.assert_called_once()
+        event_type, listener = mock_hass.bus.async_listen_once.call_args[0]
+        assert event_type == EVENT_HOMEASSISTANT_FINAL_WRITE
+        # The unsubscribe callback is released with the entry
+        mock_config_entry.async_on_unload.assert_called_once_with(mock_hass.bus.async_listen_once.return_value)
+
+        await listener(Mock())
+        mock_coordinator.async_shutdown.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_add_points_service(self, mock_hass, mock_config_entry, mock_coordinator):
@@ -309,7 +335,7 @@ class TestSimpleChoresIntegration:
     async def test_service_unregistration_on_unload(self, mock_hass, mock_config_entry):
         """Test services are unregistered when integration is unloaded."""
         # Set up with one entry
-        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: Mock()}}
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: Mock(async_shutdown=AsyncMock())}}
 
         # Unload should remove services when no entries left
         await async_unload_entry(mock_hass, mock_config_entry)
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from custom_components.simplechores.models import (
     Kid,
     LedgerEntry,
@@ -10,7 +12,9 @@ from custom_components.simplechores.models import (
     PendingChore,
     RecurringChore,
     Reward,
+    RewardProgress,
     StorageModel,
+    TodoItemModel,
 )
 
 
@@ -64,6 +68,28 @@ class TestLedgerEntry:
         assert entry.delta == -20
         assert entry.kind == "spend"
 
+    def test_ledger_entry_interns_kid_id(self):
+        """Test that entries for the same kid share one kid_id string."""
+        first = LedgerEntry(ts=1.0, kid_id="".join(["ali", "ce"]), delta=5, reason="Chore", kind="earn")
+        second = LedgerEntry(ts=2.0, kid_id="".join(["al", "ice"]), delta=3, reason="Chore", kind="earn")
+        assert first.kid_id is second.kid_id
+
+    def test_ledger_entry_uses_slots(self):
+        """Test that ledger entries do not carry a per-instance __dict__."""
+        entry = LedgerEntry(ts=1.0, kid_id="alice", delta=5, reason="Chore", kind="earn")
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown_field = True
+
+
+@pytest.mark.parametrize(
+    "model_cls",
+    [Kid, LedgerEntry, Reward, PendingChore, RecurringChore, PendingApproval, TodoItemModel, RewardProgress],
+)
+def test_record_models_declare_slots(model_cls):
+    """Test that every per-record model is slotted, not just the ledger."""
+    assert "__slots__" in vars(model_cls)
+
 
 class TestReward:
     """Test Reward model."""
@@ -228,3 +254,136 @@ class TestStorageModel:
         assert len(model.rewards) == 1
         assert "test" in model.rewards
 
+    def test_ledger_totals_fold_appended_entries(self):
+        """Test per-kid aggregates catch up with appended and replaced ledgers."""
+        monday = datetime(2024, 1, 8, 9, 0)
+        model = StorageModel(ledger=[
+            LedgerEntry(ts=monday.timestamp(), kid_id="Alice", delta=10, reason="Dishes", kind="earn"),
+            LedgerEntry(ts=datetime(2024, 1, 7, 20, 0).timestamp(), kid_id="alice", delta=5, reason="Bed", kind="earn"),
+        ])
+
+        assert model.points_earned("alice") == 15
+        assert model.week_points("alice", monday) == 10
+
+        model.ledger.append(
+            LedgerEntry(ts=monday.timestamp(), kid_id="alice", delta=-4, reason="Reward", kind="spend")
+        )
+        assert model.points_earned("alice") == 15
+        assert model.points_spent("alice") == 4
+        assert model.total_points_earned() == 15
+        assert model.total_points_spent() == 4
+        assert model.week_points("alice", datetime(2024, 1, 14, 23, 0)) == 6
+
+        model.ledger = []
+        assert model.points_earned("alice") == 0
+        assert model.week_points("alice", monday) == 0
+
+    def test_week_lookup_reuses_cached_span(self):
+        """Test that week boundaries are cached and refreshed on a new week."""
+        model = StorageModel()
+        sunday = datetime(2024, 1, 14, 23, 59)
+        monday = datetime(2024, 1, 15, 0, 0)
+
+        assert model._iso_week(datetime(2024, 1, 8, 0, 0).timestamp()) == (2024, 2)
+        span = model._week_span
+        assert model._iso_week(sunday.timestamp()) == (2024, 2)
+        assert model._week_span is span
+        assert model._iso_week(monday.timestamp()) == (2024, 3)
+        assert model._week_span is not span
+
+    def test_kid_indexes_follow_collections(self):
+        """Test the per-kid indexes track helper updates and rebuild when stale."""
+        def chore(todo_uid, kid_id):
+            return PendingChore(todo_uid=todo_uid, kid_id=kid_id, title="Chore", points=5, created_ts=0.0)
+
+        model = StorageModel(pending_chores={"uid1": chore("uid1", "Alice")})
+        assert list(model.pending_by_kid["alice"]) == ["uid1"]
+
+        model.add_pending_chore(chore("uid2", "bob"))
+        by_kid = model.pending_by_kid
+        assert list(by_kid["bob"]) == ["uid2"]
+        assert model.remove_pending_chore("uid1").kid_id == "Alice"
+        assert model.pending_by_kid is by_kid  # Updated in place, not rebuilt
+        assert model.pending_by_kid["alice"] == {}
+
+        model.pending_chores["uid3"] = chore("uid3", "alice")
+        assert list(model.pending_by_kid["alice"]) == ["uid3"]
+
+        model.pending_chores = {"uid4": chore("uid4", "bob")}
+        assert list(model.pending_by_kid) == ["bob"]
+        assert list(model.pending_by_kid["bob"]) == ["uid4"]
+
+    def test_active_approvals_follow_replacement_and_stale_collections(self):
+        """Test active approvals drop replaced requests and rebuild when stale."""
+        def approval(approval_id, status="pending_approval"):
+            return PendingApproval(
+                id=approval_id, todo_uid="uid1", kid_id="alice", title="Chore", points=5,
+                completed_ts=0.0, status=status,
+            )
+
+        model = StorageModel(pending_approvals={"a1": approval("a1"), "a2": approval("a2", "rejected")})
+        assert list(model.active_approvals) == ["a1"]
+
+        model.add_approval(approval("a1", "approved"))
+        assert model.active_approvals == {}
+
+        model.add_approval(approval("a3"))
+        assert list(model.active_approvals) == ["a3"]
+        assert model.remove_approval("a3").id == "a3"
+        assert model.active_approvals == {}
+
+        model.pending_approvals["a4"] = approval("a4")
+        assert list(model.active_approvals) == ["a4"]
+
+        model.pending_approvals = {"a5": approval("a5")}
+        assert list(model.active_approvals) == ["a5"]
+
+    def test_approval_ids_for_todo_follow_approvals(self):
+        """Test the todo_uid -> approval ids index rebuilds when approvals change."""
+        def approval(approval_id, todo_uid):
+            return PendingApproval(
+                id=approval_id, todo_uid=todo_uid, kid_id="alice", title="Chore", points=5, completed_ts=0.0
+            )
+
+        model = StorageModel(pending_approvals={"a1": approval("a1", "uid1"), "a2": approval("a2", "uid1")})
+        assert model.approval_ids_for_todo("uid1") == ["a1", "a2"]
+        assert model.approval_ids_for_todo("uid2") == []
+
+        model.pending_approvals["a3"] = approval("a3", "uid2")
+        assert model.approval_ids_for_todo("uid2") == ["a3"]
+
+        model.pending_approvals = {}
+        assert model.approval_ids_for_todo("uid1") == []
+
+    def test_approval_helpers_keep_todo_index_current(self):
+        """Test add/remove keep the todo_uid index right when the size does not change."""
+        def approval(approval_id, todo_uid):
+            return PendingApproval(
+                id=approval_id, todo_uid=todo_uid, kid_id="alice", title="Chore", points=5, completed_ts=0.0
+            )
+
+        model = StorageModel(pending_approvals={"a1": approval("a1", "uid1")})
+        assert model.approval_ids_for_todo("uid1") == ["a1"]
+
+        # Remove then add between lookups leaves pending_approvals the same size
+        model.remove_approval("a1")
+        model.add_approval(approval("a2", "uid2"))
+        assert model.approval_ids_for_todo("uid1") == []
+        assert model.approval_ids_for_todo("uid2") == ["a2"]
+
+        # Replacing an id moves it to the new todo item
+        model.add_approval(approval("a2", "uid3"))
+        assert model.approval_ids_for_todo("uid2") == []
+        assert model.approval_ids_for_todo("uid3") == ["a2"]
+
+    def test_set_approval_status_updates_active_approvals(self):
+        """Test deciding an approval drops it from the active index."""
+        model = StorageModel()
+        model.add_approval(PendingApproval(
+            id="a1", todo_uid="uid1", kid_id="alice", title="Chore", points=5, completed_ts=0.0
+        ))
+        assert list(model.active_approvals) == ["a1"]
+
+        assert model.set_approval_status("a1", "approved").status == "approved"
+        assert model.active_approvals == {}
+        assert model.set_approval_status("missing", "approved") is None
@@ -15,7 +15,9 @@ from custom_components.simplechores.sensor import (
     SimpleChoresWeekSensor,
 )
 from custom_components.simplechores.text import (
+    SimpleChoresChoreKid,
     SimpleChoresChoreTitle,
+    SimpleChoresRecurringDay,
     async_setup_entry as text_setup,
 )
 
@@ -47,8 +49,7 @@ class TestSimpleChoresNumber:
         assert entity._attr_native_step == 1
 
         # Should register itself with coordinator
-        assert hasattr(mock_coordinator, '_entities')
-        assert mock_coordinator._entities["alice"] == entity
+        mock_coordinator.register_entity.assert_called_once_with("alice", entity)
 
     def test_native_value(self, mock_coordinator):
         """Test getting native value."""
@@ -73,6 +74,8 @@ class TestSimpleChoresNumber:
 
         mock_coordinator.add_points.assert_called_once_with("alice", 25, "Manual adjust", "adjust")
         mock_coordinator.remove_points.assert_not_called()
+        # add_points already pushes the new state
+        entity.async_write_ha_state.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_set_native_value_decrease(self, mock_coordinator):
@@ -86,8 +89,8 @@ class TestSimpleChoresNumber:
 
         await entity.async_set_native_value(30.0)
 
-        mock_coordinator.remove_points.assert_called_once_with("alice", 20, "Manual adjust", "adjust")
-        mock_coordinator.add_points.assert_not_called()
+        mock_coordinator.add_points.assert_called_once_with("alice", -20, "Manual adjust", "adjust")
+        mock_coordinator.remove_points.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_set_native_value_no_change(self, mock_coordinator):
@@ -103,6 +106,7 @@ class TestSimpleChoresNumber:
 
         mock_coordinator.add_points.assert_not_called()
         mock_coordinator.remove_points.assert_not_called()
+        entity.async_write_ha_state.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_number_setup_entry(self):
@@ -209,7 +213,7 @@ class TestSimpleChoresText:
         """Test chore title entity initialization."""
         entity = SimpleChoresChoreTitle(mock_coordinator)
 
-        assert entity._coord == mock_coordinator
+        assert not hasattr(entity, "_coord")
         assert entity._attr_unique_id == f"{DOMAIN}_chore_title_input"
         assert entity._attr_name == "SimpleChores Chore Title"
         assert entity._attr_native_value == ""
@@ -234,6 +238,29 @@ class TestSimpleChoresText:
         assert entity._attr_native_value == "Clean room"
         entity.async_write_ha_state.assert_called_once()
 
+        # Re-applying the same value does not write state again
+        await entity.async_set_value("Clean room")
+        entity.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_inputs_ignore_invalid_values(self, mock_coordinator):
+        """Test that validated inputs keep their value on invalid input."""
+        kid_input = SimpleChoresChoreKid(mock_coordinator, ("alice", "bob"))
+        day_input = SimpleChoresRecurringDay(mock_coordinator)
+        for entity in (kid_input, day_input):
+            entity.async_write_ha_state = Mock()
+
+        assert kid_input.native_value == "alice"
+        await kid_input.async_set_value("charlie")
+        await day_input.async_set_value("9")
+        assert kid_input.native_value == "alice"
+        assert day_input.native_value == "0"
+
+        await kid_input.async_set_value("bob")
+        await day_input.async_set_value("4")
+        assert kid_input.native_value == "bob"
+        assert day_input.native_value == "4"
+
     @pytest.mark.asyncio
     async def test_text_setup_entry(self):
         """Test text platform setup."""
@@ -331,4 +331,10 @@ class TestRewardTypes:
         
         assert not reward.is_point_based()
         assert not reward.is_completion_based()
-        assert reward.is_streak_based()
\ No newline at end of file
+        assert reward.is_streak_based()
+
+    def test_reward_type_follows_requirement_precedence(self):
+        """Test the precomputed reward type when several requirements are set."""
+        reward = Reward(id="mixed", title="Mixed", cost=5, required_completions=3)
+        assert reward.reward_type == "point"
+        assert Reward(id="none", title="No requirement").reward_type == "none"
@@ -1,6 +1,6 @@
 """Comprehensive tests for sensor platform functionality."""
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,10 +9,12 @@ from custom_components.simplechores.sensor import (
     SimpleChoresWeekSensor,
     SimpleChoresTotalSensor, 
     SimpleChoresPendingApprovalsSensor,
+    SimpleChoresRewardProgressSensor,
     async_setup_entry
 )
+from custom_components.simplechores.const import SIGNAL_APPROVALS_UPDATED
 from custom_components.simplechores.coordinator import SimpleChoresCoordinator
-from custom_components.simplechores.models import StorageModel, LedgerEntry, PendingApproval
+from custom_components.simplechores.models import StorageModel, LedgerEntry, PendingApproval, Reward, RewardProgress
 
 
 class TestSimpleChoresWeekSensor:
@@ -98,6 +100,20 @@ class TestSimpleChoresWeekSensor:
         # Should return 0 for kid with no entries
         assert sensor.native_value == 0
     
+    def test_native_value_counts_from_monday_midnight(self, coordinator):
+        """Test that the week starts at Monday 00:00, not the current time of day."""
+        sensor = SimpleChoresWeekSensor(coordinator, "alice")
+        now = datetime.now()
+        monday_midnight = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+        coordinator.model.ledger = [
+            LedgerEntry(kid_id="alice", delta=7, reason="Early chore",
+                        ts=(monday_midnight + timedelta(seconds=30)).timestamp(), kind="earn"),
+            LedgerEntry(kid_id="alice", delta=9, reason="Sunday chore",
+                        ts=(monday_midnight - timedelta(seconds=30)).timestamp(), kind="earn"),
+        ]
+
+        assert sensor.native_value == 7
+
     def test_native_value_empty_ledger(self, coordinator):
         """Test native value with empty ledger."""
         sensor = SimpleChoresWeekSensor(coordinator, "alice")
@@ -163,6 +179,33 @@ class TestSimpleChoresWeekSensor:
         # Should only count entries from Monday onwards: 5 + 3 = 8
         assert sensor.native_value == 8
 
+    @pytest.mark.asyncio
+    async def test_pushed_on_ledger_change_and_week_rollover(self, coordinator):
+        """Test that the sensor is pushed by the coordinator rather than polled."""
+        sensor = SimpleChoresWeekSensor(coordinator, "alice")
+        sensor.hass = coordinator.hass
+        sensor.async_on_remove = Mock()
+        sensor.async_write_ha_state = Mock()
+        assert sensor.should_poll is False
+
+        with patch(
+            "custom_components.simplechores.sensor.async_track_time_change"
+        ) as mock_track:
+            await sensor.async_added_to_hass()
+
+        mock_track.assert_called_once_with(
+            coordinator.hass, sensor._async_midnight, hour=0, minute=0, second=0
+        )
+        coordinator._update_entities = AsyncMock()
+        await coordinator.add_points("Alice", 5, "Chore")
+        await coordinator.add_points("bob", 5, "Chore")
+        sensor.async_write_ha_state.assert_called_once()
+
+        sensor._async_midnight(datetime(2024, 1, 2))  # Tuesday
+        sensor.async_write_ha_state.assert_called_once()
+        sensor._async_midnight(datetime(2024, 1, 8))  # Monday
+        assert sensor.async_write_ha_state.call_count == 2
+
 
 class TestSimpleChoresTotalSensor:
     """Test total points sensor functionality."""
@@ -307,12 +350,22 @@ class TestSimpleChoresPendingApprovalsSensor:
         assert approval_sensor._attr_name == "Pending Chore Approvals"
         assert approval_sensor._attr_icon == "mdi:clipboard-check-multiple"
     
-    def test_coordinator_registration(self, coordinator):
-        """Test that sensor registers with coordinator."""
+    @pytest.mark.asyncio
+    async def test_subscribes_to_approval_updates(self, coordinator):
+        """Test that the sensor refreshes on the approval update signal."""
         sensor = SimpleChoresPendingApprovalsSensor(coordinator)
-        
-        assert hasattr(coordinator, "_approval_sensors")
-        assert sensor in coordinator._approval_sensors
+        sensor.hass = coordinator.hass
+        sensor.async_on_remove = Mock()
+
+        with patch(
+            "custom_components.simplechores.sensor.async_dispatcher_connect"
+        ) as mock_connect:
+            await sensor.async_added_to_hass()
+
+        mock_connect.assert_called_once_with(
+            coordinator.hass, SIGNAL_APPROVALS_UPDATED, sensor.async_write_ha_state
+        )
+        sensor.async_on_remove.assert_called_once_with(mock_connect.return_value)
     
     def test_native_value_with_pending_approvals(self, coordinator_with_approvals):
         """Test native value with pending approvals."""
@@ -370,6 +423,23 @@ class TestSimpleChoresPendingApprovalsSensor:
         assert attributes["count"] == 0
         assert attributes["approvals"] == []
     
+    def test_extra_state_attributes_rebuilt_when_approvals_change(self, coordinator):
+        """Test that attributes are reused until the approvals change."""
+        sensor = SimpleChoresPendingApprovalsSensor(coordinator)
+        first = sensor.extra_state_attributes
+        assert sensor.extra_state_attributes is first
+
+        coordinator.add_approval(PendingApproval(
+            id="approval1", todo_uid="uid1", kid_id="alice", title="Clean room",
+            points=5, completed_ts=datetime.now().timestamp()
+        ))
+        second = sensor.extra_state_attributes
+        assert second is not first
+        assert second["count"] == 1
+
+        coordinator.remove_approval("approval1")
+        assert sensor.extra_state_attributes["count"] == 0
+
     def test_extra_state_attributes_no_model(self, coordinator):
         """Test extra state attributes when model is None."""
         sensor = SimpleChoresPendingApprovalsSensor(coordinator)
@@ -393,6 +463,26 @@ class TestSimpleChoresPendingApprovalsSensor:
         assert sensor.available is False
 
 
+class TestSimpleChoresRewardProgressSensor:
+    """Test reward progress sensor functionality."""
+
+    def test_attributes_reused_until_progress_changes(self, coordinator):
+        """Test that attributes are rebuilt only when the progress changes."""
+        reward = Reward(id="trash_master", title="Trash Master", required_completions=4)
+        sensor = SimpleChoresRewardProgressSensor(coordinator, "alice", reward)
+        progress = RewardProgress(kid_id="alice", reward_id="trash_master", current_completions=1)
+        coordinator.model.reward_progress["alice_trash_master"] = progress
+
+        first = sensor.extra_state_attributes
+        assert first["progress_percentage"] == 25
+        assert sensor.extra_state_attributes is first
+
+        progress.current_completions = 2
+        second = sensor.extra_state_attributes
+        assert second is not first
+        assert second["remaining_completions"] == 2
+
+
 class TestSensorSetupEntry:
     """Test sensor platform setup."""
     
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from custom_components.simplechores.const import STORAGE_KEY, STORAGE_VERSION
-from custom_components.simplechores.models import Kid, LedgerEntry, PendingChore, Reward, StorageModel
+from custom_components.simplechores.models import Kid, LedgerEntry, PendingChore, Reward, StorageModel, TodoItemModel
 from custom_components.simplechores.storage import SimpleChoresStore
 
 
@@ -61,7 +61,7 @@ class TestSimpleChoresStore:
 
     def test_init(self, mock_hass):
         """Test SimpleChoresStore initialization."""
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             store = SimpleChoresStore(mock_hass)
             mock_store_class.assert_called_once_with(mock_hass, STORAGE_VERSION, STORAGE_KEY)
             assert store._store == mock_store_class.return_value
@@ -69,7 +69,7 @@ class TestSimpleChoresStore:
     @pytest.mark.asyncio
     async def test_async_load_with_data(self, mock_hass, mock_store_data):
         """Test loading data from store."""
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             mock_store = mock_store_class.return_value
             mock_store.async_load = AsyncMock(return_value=mock_store_data)
 
@@ -113,7 +113,7 @@ class TestSimpleChoresStore:
     @pytest.mark.asyncio
     async def test_async_load_empty(self, mock_hass):
         """Test loading with no existing data."""
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             mock_store = mock_store_class.return_value
             mock_store.async_load = AsyncMock(return_value=None)
 
@@ -132,7 +132,7 @@ class TestSimpleChoresStore:
             "kids": {"charlie": {"id": "charlie", "name": "Charlie", "points": 25}}
         }
 
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             mock_store = mock_store_class.return_value
             mock_store.async_load = AsyncMock(return_value=partial_data)
 
@@ -148,7 +148,7 @@ class TestSimpleChoresStore:
     @pytest.mark.asyncio
     async def test_async_save(self, mock_hass):
         """Test saving data to store."""
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             mock_store = mock_store_class.return_value
             mock_store.async_save = AsyncMock()
 
@@ -191,16 +191,18 @@ class TestSimpleChoresStore:
             assert saved_data["kids"]["test"]["name"] == "Test"
             assert saved_data["kids"]["test"]["points"] == 100
 
-            # Check ledger data
+            # Check ledger data (stored column-wise)
             assert "ledger" in saved_data
-            assert len(saved_data["ledger"]) == 1
-            assert saved_data["ledger"][0]["kid_id"] == "test"
-            assert saved_data["ledger"][0]["delta"] == 50
+            assert saved_data["ledger"]["ts"] == [1234567890.0]
+            assert saved_data["ledger"]["kid_id"] == ["test"]
+            assert saved_data["ledger"]["delta"] == [50]
+            assert saved_data["ledger"]["kind"] == ["earn"]
 
             # Check rewards data
             assert "rewards" in saved_data
             assert "test_reward" in saved_data["rewards"]
             assert saved_data["rewards"]["test_reward"]["title"] == "Test Reward"
+            assert "reward_type" not in saved_data["rewards"]["test_reward"]
 
             # Check pending chores data
             assert "pending_chores" in saved_data
@@ -210,7 +212,7 @@ class TestSimpleChoresStore:
     @pytest.mark.asyncio
     async def test_async_save_empty_model(self, mock_hass):
         """Test saving empty model."""
-        with patch('custom_components.simplechores.storage.Store') as mock_store_class:
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
             mock_store = mock_store_class.return_value
             mock_store.async_save = AsyncMock()
 
@@ -223,7 +225,114 @@ class TestSimpleChoresStore:
             saved_data = mock_store.async_save.call_args[0][0]
 
             assert saved_data["kids"] == {}
-            assert saved_data["ledger"] == []
+            assert all(column == [] for column in saved_data["ledger"].values())
             assert saved_data["rewards"] == {}
             assert saved_data["pending_chores"] == {}
 
+
+    @pytest.mark.asyncio
+    async def test_async_load_legacy_todo_item_list(self, mock_hass):
+        """Test loading todo items stored in the older list layout."""
+        legacy_data = {
+            "todo_items": [
+                {
+                    "uid": "uid1",
+                    "summary": "Dishes (+5)",
+                    "status": "needs_action",
+                    "kid_id": "alice",
+                    "created_ts": 1.0,
+                },
+            ]
+        }
+
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
+            mock_store = mock_store_class.return_value
+            mock_store.async_load = AsyncMock(return_value=legacy_data)
+
+            store = SimpleChoresStore(mock_hass)
+            model = await store.async_load()
+
+            assert list(model.todo_items) == ["uid1"]
+            assert model.todo_items["uid1"].summary == "Dishes (+5)"
+            assert list(model.todo_items_by_kid["alice"]) == ["uid1"]
+
+    @pytest.mark.asyncio
+    async def test_async_load_columnar_ledger(self, mock_hass):
+        """Test loading a ledger stored column-wise."""
+        data = {
+            "ledger": {
+                "ts": [1.0, 2.0],
+                "kid_id": ["alice", "bob"],
+                "delta": [5, -3],
+                "reason": ["Dishes", "Reward"],
+                "kind": ["earn", "spend"],
+            }
+        }
+
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
+            mock_store = mock_store_class.return_value
+            mock_store.async_load = AsyncMock(return_value=data)
+
+            store = SimpleChoresStore(mock_hass)
+            model = await store.async_load()
+
+            assert model.ledger == [
+                LedgerEntry(ts=1.0, kid_id="alice", delta=5, reason="Dishes", kind="earn"),
+                LedgerEntry(ts=2.0, kid_id="bob", delta=-3, reason="Reward", kind="spend"),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_async_load_rejects_partial_ledger_columns(self, mock_hass):
+        """Test that a column-wise ledger with missing or short columns is refused."""
+        columns = {
+            "ts": [1.0, 2.0],
+            "kid_id": ["alice", "bob"],
+            "delta": [5, -3],
+            "reason": ["Dishes", "Reward"],
+            "kind": ["earn", "spend"],
+        }
+        missing = {name: column for name, column in columns.items() if name != "reason"}
+        short = {**columns, "delta": [5]}
+
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
+            mock_store = mock_store_class.return_value
+            store = SimpleChoresStore(mock_hass)
+
+            mock_store.async_load = AsyncMock(return_value={"ledger": missing})
+            with pytest.raises(ValueError, match="missing columns: reason"):
+                await store.async_load()
+
+            mock_store.async_load = AsyncMock(return_value={"ledger": short})
+            with pytest.raises(ValueError, match="differ in length"):
+                await store.async_load()
+
+    @pytest.mark.asyncio
+    async def test_migrate_row_ledger_to_columns(self, mock_hass, mock_store_data):
+        """Test that version 2 data is migrated to the column-wise ledger."""
+        store = SimpleChoresStore(mock_hass)
+
+        migrated = await store._store._async_migrate_func(2, 1, mock_store_data)
+
+        assert STORAGE_VERSION == 3
+        assert migrated["ledger"] == {
+            "ts": [1234567890.0],
+            "kid_id": ["alice"],
+            "delta": [10],
+            "reason": ["Cleaned room"],
+            "kind": ["earn"],
+        }
+        assert migrated["kids"] == mock_store_data["kids"]
+
+    @pytest.mark.asyncio
+    async def test_async_save_todo_items_keyed_by_uid(self, mock_hass):
+        """Test that todo items are saved as a dict keyed by uid."""
+        with patch('custom_components.simplechores.storage._MigratingStore') as mock_store_class:
+            mock_store = mock_store_class.return_value
+            mock_store.async_save = AsyncMock()
+
+            store = SimpleChoresStore(mock_hass)
+            item = TodoItemModel(uid="uid1", summary="Dishes", status="completed", kid_id="alice")
+            await store.async_save(StorageModel(todo_items={"uid1": item}))
+
+            saved_data = mock_store.async_save.call_args[0][0]
+            assert saved_data["todo_items"]["uid1"]["status"] == "completed"
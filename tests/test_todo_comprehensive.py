@@ -77,10 +77,11 @@ class TestTodoItemCreation:
         assert len(todo_list._items) == 1
         assert todo_list._items[0].summary == "Clean room"
         assert todo_list._items[0].status == TodoItemStatus.NEEDS_ACTION
+        assert todo_list._item_index[item.uid] == 0
 
         # Should trigger state updates
         todo_list.async_write_ha_state.assert_called_once()
-        todo_list.async_schedule_update_ha_state.assert_called_once()
+        todo_list.async_schedule_update_ha_state.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_create_item_missing_properties(self, todo_list):
@@ -200,6 +201,7 @@ class TestTodoItemUpdates:
 
         # Mock coordinator methods
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
         coordinator.get_pending_approvals = Mock(return_value=[])
 
@@ -226,7 +228,8 @@ class TestTodoItemUpdates:
             assert found_item.status == TodoItemStatus.NEEDS_ACTION
 
             # Should save and update buttons
-            coordinator.async_save.assert_called_once()
+            coordinator.async_save.assert_not_called()
+            coordinator.async_schedule_save.assert_called()
             coordinator._update_approval_buttons.assert_called_once()
 
     @pytest.mark.asyncio
@@ -273,6 +276,7 @@ class TestTodoItemUpdates:
             )
         }
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Uncheck the pending approval item (completed -> needs_action)
@@ -300,7 +304,8 @@ class TestTodoItemUpdates:
             assert coordinator.model.pending_chores["pending_uid"].status == "pending"
 
         # Should save and update buttons
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_called_once()
 
     @pytest.mark.asyncio
@@ -322,6 +327,30 @@ class TestTodoItemUpdates:
         assert len(todo_list._items) == 3
         todo_list.async_write_ha_state.assert_called_once()  # Still called at end
 
+    @pytest.mark.asyncio
+    async def test_unchanged_update_skips_state_write(self, todo_list_with_items):
+        """Test that re-sending an unchanged item does not write state."""
+        todo_list = todo_list_with_items
+        todo_list.async_write_ha_state = Mock()
+
+        unchanged = TodoItem(
+            summary="Manual chore (+3)",
+            uid="manual_uid",
+            status=TodoItemStatus.NEEDS_ACTION
+        )
+        await todo_list.async_update_item(unchanged)
+
+        todo_list.async_write_ha_state.assert_not_called()
+
+    def test_find_item_follows_list_changes(self, todo_list_with_items):
+        """Test that the uid index is rebuilt when the item list changes under it."""
+        todo_list = todo_list_with_items
+
+        assert todo_list._find_item("pending_uid") == 2
+        del todo_list._items[0]
+        assert todo_list._find_item("pending_uid") == 1
+        assert todo_list._find_item("tracked_uid") is None
+
     @pytest.mark.asyncio
     async def test_async_update_todo_item_wrapper_none(self, todo_list_with_items):
         """Test wrapper method with None item."""
@@ -351,6 +380,23 @@ class TestTodoItemUpdates:
             # Should log error about missing UID
             mock_logger.error.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_async_update_todo_item_skips_diagnostics_when_debug_disabled(self, todo_list_with_items):
+        """Test the wrapper does no diagnostic work when debug logging is off."""
+        todo_list = todo_list_with_items
+        todo_list.async_update_item = AsyncMock()
+        todo_list._find_item = Mock()
+
+        item = TodoItem(summary="Test item", uid="test_uid", status=TodoItemStatus.COMPLETED)
+
+        with patch('custom_components.simplechores.todo._LOGGER') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            await todo_list.async_update_todo_item(item)
+
+            todo_list._find_item.assert_not_called()
+            mock_logger.debug.assert_called_once()  # Only the completion line
+            todo_list.async_update_item.assert_awaited_once_with(item)
+
     @pytest.mark.asyncio
     async def test_async_update_todo_item_wrapper_exception(self, todo_list_with_items):
         """Test wrapper method exception handling."""
@@ -398,6 +444,7 @@ class TestTodoItemDeletion:
         assert "uid1" in remaining_uids
         assert "uid3" in remaining_uids
         assert "uid2" not in remaining_uids
+        assert todo_list._items[todo_list._find_item("uid3")].uid == "uid3"
 
         todo_list.async_write_ha_state.assert_called_once()
 
@@ -417,15 +464,16 @@ class TestTodoItemDeletion:
     async def test_async_delete_todo_items_wrapper(self, todo_list_with_items):
         """Test the Home Assistant wrapper method for multiple deletions."""
         todo_list = todo_list_with_items
-        todo_list.async_delete_item = AsyncMock()
+        todo_list.async_write_ha_state = Mock()
+        todo_list._coord.remove_todo_items = AsyncMock()
 
         uids_to_delete = ["uid1", "uid3"]
         await todo_list.async_delete_todo_items(uids_to_delete)
 
-        # Should call async_delete_item for each UID
-        assert todo_list.async_delete_item.call_count == 2
-        todo_list.async_delete_item.assert_any_call("uid1")
-        todo_list.async_delete_item.assert_any_call("uid3")
+        # Should remove both items with one storage update and one state write
+        assert [item.uid for item in todo_list._items] == ["uid2"]
+        todo_list._coord.remove_todo_items.assert_called_once_with(set(uids_to_delete))
+        todo_list.async_write_ha_state.assert_called_once()
 
 
 class TestTodoItemRetrieval:
@@ -591,6 +639,7 @@ class TestTodoItemDeletionWithPendingData:
         # Mock methods
         todo_list.async_write_ha_state = Mock()
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_item("regular-uid")
@@ -618,6 +667,7 @@ class TestTodoItemDeletionWithPendingData:
         # Mock methods
         todo_list.async_write_ha_state = Mock()
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_item("pending-uid")
@@ -634,7 +684,8 @@ class TestTodoItemDeletionWithPendingData:
         assert "approval-123" in coordinator.model.pending_approvals
 
         # Should save coordinator state
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_not_called()  # No approvals removed
         todo_list.async_write_ha_state.assert_called_once()
 
@@ -647,6 +698,7 @@ class TestTodoItemDeletionWithPendingData:
         # Mock methods
         todo_list.async_write_ha_state = Mock()
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_item("approval-uid")
@@ -663,7 +715,8 @@ class TestTodoItemDeletionWithPendingData:
         assert "pending-uid" in coordinator.model.pending_chores
 
         # Should save coordinator state and update approval buttons
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_called_once()
         todo_list.async_write_ha_state.assert_called_once()
 
@@ -686,6 +739,7 @@ class TestTodoItemDeletionWithPendingData:
         # Mock methods
         todo_list.async_write_ha_state = Mock()
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_item("approval-uid")
@@ -703,7 +757,8 @@ class TestTodoItemDeletionWithPendingData:
         assert "pending-uid" in coordinator.model.pending_chores
 
         # Should save coordinator state and update approval buttons
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_called_once()
         todo_list.async_write_ha_state.assert_called_once()
 
@@ -716,6 +771,7 @@ class TestTodoItemDeletionWithPendingData:
         # Mock methods
         todo_list.async_write_ha_state = Mock()
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_item("nonexistent-uid")
@@ -736,16 +792,26 @@ class TestTodoItemDeletionWithPendingData:
     async def test_delete_multiple_items_via_wrapper(self, todo_list_with_pending_data):
         """Test deleting multiple items via async_delete_todo_items."""
         todo_list = todo_list_with_pending_data
+        coordinator = todo_list._coord
 
-        # Mock the single delete method to track calls
-        todo_list.async_delete_item = AsyncMock()
+        # Mock methods
+        todo_list.async_write_ha_state = Mock()
+        coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
+        coordinator._update_approval_buttons = AsyncMock()
 
         await todo_list.async_delete_todo_items(["pending-uid", "approval-uid"])
 
-        # Should call async_delete_item for each UID
-        assert todo_list.async_delete_item.call_count == 2
-        todo_list.async_delete_item.assert_any_call("pending-uid")
-        todo_list.async_delete_item.assert_any_call("approval-uid")
+        # Should clean up both items' pending data
+        assert [item.uid for item in todo_list._items] == ["regular-uid"]
+        assert "pending-uid" not in coordinator.model.pending_chores
+        assert "approval-123" not in coordinator.model.pending_approvals
+
+        # Should batch the follow-up work
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
+        coordinator._update_approval_buttons.assert_called_once()
+        todo_list.async_write_ha_state.assert_called_once()
 
 
 class TestTodoItemUncheckingBehavior:
@@ -796,6 +862,7 @@ class TestTodoItemUncheckingBehavior:
             )
         }
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Simulate that the item was previously completed (old status)
@@ -817,7 +884,8 @@ class TestTodoItemUncheckingBehavior:
 
         # Should clean up approval data
         assert "approval456" not in coordinator.model.pending_approvals
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_called_once()
 
     @pytest.mark.asyncio
@@ -839,6 +907,7 @@ class TestTodoItemUncheckingBehavior:
             )
         }
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Simulate that the item was previously completed
@@ -868,6 +937,7 @@ class TestTodoItemUncheckingBehavior:
         # No approval data in coordinator
         coordinator.model.pending_approvals = {}
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Simulate that the item was previously completed
@@ -888,7 +958,8 @@ class TestTodoItemUncheckingBehavior:
         assert "[PENDING APPROVAL]" not in found_item.summary
 
         # Should save coordinator state even if no approvals removed
-        coordinator.async_save.assert_called_once()
+        coordinator.async_save.assert_not_called()
+        coordinator.async_schedule_save.assert_called()
         coordinator._update_approval_buttons.assert_called_once()
 
     @pytest.mark.asyncio
@@ -920,6 +991,7 @@ class TestTodoItemUncheckingBehavior:
             )
         }
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Simulate that the item was previously completed
@@ -953,6 +1025,7 @@ class TestTodoItemUncheckingBehavior:
         todo_list.async_write_ha_state = Mock()
 
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
         coordinator.save_todo_item = AsyncMock()
 
@@ -1013,6 +1086,7 @@ class TestTodoItemUncheckingBehavior:
             ),
         }
         coordinator.async_save = AsyncMock()
+        coordinator.async_schedule_save = Mock()
         coordinator._update_approval_buttons = AsyncMock()
 
         # Simulate that the item was previously completed
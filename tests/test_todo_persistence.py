@@ -21,7 +21,7 @@ class TestTodoPersistence:
         """Return a mock coordinator with persistence methods."""
         coordinator = Mock(spec=SimpleChoresCoordinator)
         coordinator.model = StorageModel()
-        coordinator.model.todo_items = []
+        coordinator.model.todo_items = {}
         coordinator.model.pending_chores = {}
         coordinator.model.pending_approvals = {}
         
@@ -79,6 +79,11 @@ class TestTodoPersistence:
         assert items[1].summary == "Stored chore 2 (+15)" 
         assert items[1].status == TodoItemStatus.COMPLETED
 
+        assert todo_list._item_index == {"item-1": 0, "item-2": 1}
+
+        # The platform writes state after async_added_to_hass; restore must not
+        todo_list.async_write_ha_state.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_todo_item_creation_persists(self, mock_coordinator):
         """Test that creating a todo item saves it to persistent storage."""